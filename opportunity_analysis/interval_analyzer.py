@@ -1,6 +1,7 @@
 """Interval mismatch detection and analysis."""
 import logging
-from typing import List, Dict, Any, Tuple
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 import pandas as pd
 import numpy as np
@@ -15,6 +16,29 @@ from data_collector.utils import timestamp_to_datetime, interval_to_hours, stand
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class HourlyGrid:
+    """Hourly analysis grid shared by every symbol of a run."""
+    times: pd.DatetimeIndex  # hourly_grid(start_time, end_time)
+    ms: np.ndarray  # the same hours as int64 ms timestamps
+
+
+def find_true_runs(mask: np.ndarray) -> np.ndarray:
+    """
+    Locate contiguous runs of True values in a boolean array.
+    
+    Args:
+        mask: 1-D boolean array
+    
+    Returns:
+        int64 array of shape (n_runs, 2) with inclusive (start, end) indices
+    """
+    padded = np.concatenate(([False], np.asarray(mask, dtype=bool), [False]))
+    # diff of a bool array is not_equal, so edges alternate run start / one-past-end
+    edges = np.flatnonzero(np.diff(padded))
+    return np.column_stack((edges[::2], edges[1::2] - 1))
+
+
 class IntervalAnalyzer:
     """Analyze funding interval mismatches between exchanges."""
     
@@ -22,63 +46,110 @@ class IntervalAnalyzer:
         self.mismatch_threshold = MISMATCH_THRESHOLD
         self.valid_intervals = VALID_INTERVALS
     
+    @staticmethod
+    def to_funding_arrays(
+        funding_data: Union[List[Dict[str, Any]], Dict[str, np.ndarray]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert funding records to columnar numpy arrays.
+        
+        Already-converted data is returned unchanged, so every analyzer method
+        accepts either form.
+        
+        Args:
+            funding_data: List of funding records or dict of arrays
+        
+        Returns:
+            Dict with 'fundingTime' (int64 ms), 'fundingRate' (float64) and
+            'interval' (float64 seconds, NaN where unknown)
+        """
+        if isinstance(funding_data, dict):
+            return funding_data
+        
+        n = len(funding_data)
+        return {
+            'fundingTime': np.fromiter(
+                (r['fundingTime'] for r in funding_data), dtype=np.int64, count=n
+            ),
+            'fundingRate': np.fromiter(
+                (r['fundingRate'] for r in funding_data), dtype=np.float64, count=n
+            ),
+            'interval': np.fromiter(
+                (np.nan if r['interval'] is None else r['interval'] for r in funding_data),
+                dtype=np.float64,
+                count=n
+            )
+        }
+    
     def create_interval_timeline(
         self,
-        funding_data: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+        funding_data: Union[List[Dict[str, Any]], Dict[str, np.ndarray]]
+    ) -> Dict[str, np.ndarray]:
         """
         Create a timeline of interval periods from funding data.
         Each period represents the interval that was active between two funding events.
         
         Args:
-            funding_data: Processed funding data with intervals
+            funding_data: Processed funding data with intervals (records or arrays)
         
         Returns:
-            List of timeline periods with start, end, interval, and rate
+            Dict of arrays 'start', 'end', 'interval' and 'rate', one entry per period
         """
-        if not funding_data or len(funding_data) < 2:
-            return []
+        arrays = self.to_funding_arrays(funding_data)
+        funding_time = arrays['fundingTime']
         
-        timeline = []
-        for i in range(len(funding_data) - 1):
-            current = funding_data[i]
-            next_record = funding_data[i + 1]
-            
-            if current['interval'] is not None:
-                timeline.append({
-                    'start': current['fundingTime'],
-                    'end': next_record['fundingTime'],
-                    'interval': current['interval'],
-                    'interval_hours': current['interval_hours'],
-                    'rate': current['fundingRate']
-                })
-        
-        return timeline
+        if len(funding_time) < 2:
+            return {
+                'start': np.empty(0, dtype=np.int64),
+                'end': np.empty(0, dtype=np.int64),
+                'interval': np.empty(0, dtype=np.float64),
+                'rate': np.empty(0, dtype=np.float64)
+            }
+        
+        # Period i runs from record i to record i+1; skip records without an interval
+        has_interval = ~np.isnan(arrays['interval'][:-1])
+        return {
+            'start': funding_time[:-1][has_interval],
+            'end': funding_time[1:][has_interval],
+            'interval': arrays['interval'][:-1][has_interval],
+            'rate': arrays['fundingRate'][:-1][has_interval]
+        }
     
-    def get_interval_at_time(
+    def lookup_intervals(
         self,
-        timeline: List[Dict[str, Any]],
-        query_time: int
-    ) -> Tuple[int, float]:
+        timeline: Dict[str, np.ndarray],
+        query_times: np.ndarray
+    ) -> Dict[str, np.ndarray]:
         """
-        Get the active interval at a specific time.
+        Get the active interval and funding rate at each query time.
+        
+        Periods are sorted and non-overlapping, so the active period is the last
+        one starting at or before the query time, if the query falls before its end.
         
         Args:
-            timeline: Interval timeline
-            query_time: Query timestamp in milliseconds
+            timeline: Interval timeline from create_interval_timeline
+            query_times: Query timestamps in milliseconds (int64 array)
         
         Returns:
-            Tuple of (interval_seconds, funding_rate) or (None, None)
+            Dict with 'interval' (seconds) and 'rate' arrays, NaN where no period is active
         """
-        for period in timeline:
-            if period['start'] <= query_time < period['end']:
-                return period['interval'], period['rate']
-        return None, None
+        if len(timeline['start']) == 0:
+            missing = np.full(len(query_times), np.nan)
+            return {'interval': missing, 'rate': missing.copy()}
+        
+        idx = np.searchsorted(timeline['start'], query_times, side='right') - 1
+        safe_idx = np.maximum(idx, 0)
+        active = (idx >= 0) & (query_times < timeline['end'][safe_idx])
+        
+        return {
+            'interval': np.where(active, timeline['interval'][safe_idx], np.nan),
+            'rate': np.where(active, timeline['rate'][safe_idx], np.nan)
+        }
     
     def detect_mismatches(
         self,
-        binance_timeline: List[Dict[str, Any]],
-        bybit_timeline: List[Dict[str, Any]],
+        binance_timeline: Dict[str, np.ndarray],
+        bybit_timeline: Dict[str, np.ndarray],
         start_time: int,
         end_time: int,
         symbol: str
@@ -96,189 +167,211 @@ class IntervalAnalyzer:
         Returns:
             List of mismatch events
         """
-        if not binance_timeline or not bybit_timeline:
+        if len(binance_timeline['start']) == 0 or len(bybit_timeline['start']) == 0:
             logger.warning(f"Empty timeline for {symbol}")
             return []
         
         # Create hourly time grid
-        time_grid = range(start_time, end_time, 3600000)  # 1 hour in milliseconds
+        time_grid = np.arange(start_time, end_time, 3600000, dtype=np.int64)  # 1 hour in milliseconds
         
-        mismatch_events = []
-        current_mismatch = None
+        bn = self.lookup_intervals(binance_timeline, time_grid)
+        by = self.lookup_intervals(bybit_timeline, time_grid)
         
-        for t in time_grid:
-            bn_interval, bn_rate = self.get_interval_at_time(binance_timeline, t)
-            by_interval, by_rate = self.get_interval_at_time(bybit_timeline, t)
-            
-            if bn_interval is None or by_interval is None:
-                continue
-            
-            # Check if there's a mismatch
-            interval_diff = abs(bn_interval - by_interval)
-            is_mismatch = interval_diff >= self.mismatch_threshold
+        # Hours where either side has no active period are ignored entirely
+        covered = np.flatnonzero(~np.isnan(bn['interval']) & ~np.isnan(by['interval']))
+        times = time_grid[covered]
+        bn_intervals = bn['interval'][covered]
+        by_intervals = by['interval'][covered]
+        bn_rates = bn['rate'][covered]
+        by_rates = by['rate'][covered]
+        is_mismatch = np.abs(bn_intervals - by_intervals) >= self.mismatch_threshold
+        
+        mismatch_events = []
+        for run_start, run_end in find_true_runs(is_mismatch):
+            event_start = int(times[run_start])
+            # An event ends at the next covered (matching) hour, or at end_time if still ongoing
+            event_end = int(times[run_end + 1]) if run_end + 1 < len(times) else end_time
+            bn_interval = int(bn_intervals[run_start])
+            by_interval = int(by_intervals[run_start])
+            binance_rates = bn_rates[run_start:run_end + 1]
+            bybit_rates = by_rates[run_start:run_end + 1]
+            bn_hours = round(bn_interval / 3600)
+            by_hours = round(by_interval / 3600)
             
-            if is_mismatch:
-                if current_mismatch is None:
-                    # Start new mismatch event
-                    current_mismatch = {
-                        'symbol': symbol,
-                        'start_time': t,
-                        'binance_interval': bn_interval,
-                        'bybit_interval': by_interval,
-                        'binance_rates': [bn_rate],
-                        'bybit_rates': [by_rate],
-                        'interval_diff': interval_diff
-                    }
-                else:
-                    # Continue existing mismatch
-                    current_mismatch['binance_rates'].append(bn_rate)
-                    current_mismatch['bybit_rates'].append(by_rate)
-            else:
-                if current_mismatch is not None:
-                    # End current mismatch event
-                    current_mismatch['end_time'] = t
-                    current_mismatch['duration_hours'] = (t - current_mismatch['start_time']) / 3600000
-                    current_mismatch['avg_binance_rate'] = np.mean(current_mismatch['binance_rates'])
-                    current_mismatch['avg_bybit_rate'] = np.mean(current_mismatch['bybit_rates'])
-                    bn_hours = round(current_mismatch['binance_interval'] / 3600)
-                    by_hours = round(current_mismatch['bybit_interval'] / 3600)
-                    current_mismatch['mismatch_type'] = f"{bn_hours}h_vs_{by_hours}h"
-                    
-                    mismatch_events.append(current_mismatch)
-                    current_mismatch = None
-        
-        # Handle ongoing mismatch at end of period
-        if current_mismatch is not None:
-            current_mismatch['end_time'] = end_time
-            current_mismatch['duration_hours'] = (end_time - current_mismatch['start_time']) / 3600000
-            current_mismatch['avg_binance_rate'] = np.mean(current_mismatch['binance_rates'])
-            current_mismatch['avg_bybit_rate'] = np.mean(current_mismatch['bybit_rates'])
-            bn_hours = round(current_mismatch['binance_interval'] / 3600)
-            by_hours = round(current_mismatch['bybit_interval'] / 3600)
-            current_mismatch['mismatch_type'] = f"{bn_hours}h_vs_{by_hours}h"
-            mismatch_events.append(current_mismatch)
+            mismatch_events.append({
+                'symbol': symbol,
+                'start_time': event_start,
+                'binance_interval': bn_interval,
+                'bybit_interval': by_interval,
+                'binance_rates': binance_rates.tolist(),
+                'bybit_rates': bybit_rates.tolist(),
+                'interval_diff': abs(bn_interval - by_interval),
+                'end_time': event_end,
+                'duration_hours': (event_end - event_start) / 3600000,
+                'avg_binance_rate': np.mean(binance_rates),
+                'avg_bybit_rate': np.mean(bybit_rates),
+                'mismatch_type': f"{bn_hours}h_vs_{by_hours}h"
+            })
         
         logger.info(f"Found {len(mismatch_events)} mismatch events for {symbol}")
         return mismatch_events
     
-    def create_funding_rate_timeline(
+    def hourly_grid(
         self,
-        binance_timeline: List[Dict[str, Any]],
-        bybit_timeline: List[Dict[str, Any]],
         start_time: int,
         end_time: int
+    ) -> pd.DatetimeIndex:
+        """Hourly datetime grid covering [start_time, end_time] (inclusive)."""
+        return pd.date_range(
+            start=timestamp_to_datetime(start_time),
+            end=timestamp_to_datetime(end_time),
+            freq='h'
+        )
+    
+    def hourly_grid_ms(
+        self,
+        start_time: int,
+        end_time: int
+    ) -> HourlyGrid:
+        """
+        hourly_grid(start_time, end_time) together with its int64 ms timestamps.
+        
+        The grid is the same for every symbol in a run, so callers build it
+        once and pass it to create_funding_rate_timeline/create_interval_matrix.
+        """
+        times = self.hourly_grid(start_time, end_time)
+        return HourlyGrid(times=times, ms=times.as_unit('ms').asi8)
+    
+    def create_funding_rate_timeline(
+        self,
+        binance_timeline: Dict[str, np.ndarray],
+        bybit_timeline: Dict[str, np.ndarray],
+        start_time: int,
+        end_time: int,
+        grid: Optional[HourlyGrid] = None
     ) -> pd.DataFrame:
         """
         Create a complete timeline of funding rates for the entire analysis period.
         This captures ALL rates (not just during mismatches) for complete time-series analysis.
         
+        Args:
+            grid: Optional hourly_grid_ms(start_time, end_time), built here if omitted
+        
         Returns:
             DataFrame with datetime, binance_interval, bybit_interval, binance_rate, bybit_rate, and mismatch flag
         """
-        # Create hourly time grid
-        time_grid = pd.date_range(
-            start=timestamp_to_datetime(start_time),
-            end=timestamp_to_datetime(end_time),
-            freq='h'
+        # Hourly time grid
+        if grid is None:
+            grid = self.hourly_grid_ms(start_time, end_time)
+        time_grid, grid_ms = grid.times, grid.ms
+        
+        bn = self.lookup_intervals(binance_timeline, grid_ms)
+        by = self.lookup_intervals(bybit_timeline, grid_ms)
+        
+        # Keep only hours where both exchanges have an active interval
+        covered = ~np.isnan(bn['interval']) & ~np.isnan(by['interval'])
+        if not covered.any():
+            return pd.DataFrame()
+        
+        bn_interval = bn['interval'][covered]
+        by_interval = by['interval'][covered]
+        bn_rate = bn['rate'][covered]
+        by_rate = by['rate'][covered]
+        
+        # Check if there's a mismatch
+        is_mismatch = np.abs(bn_interval - by_interval) >= self.mismatch_threshold
+        
+        # Convert intervals to hours
+        bn_hours = np.round(bn_interval / 3600).astype(np.int64)
+        by_hours = np.round(by_interval / 3600).astype(np.int64)
+        
+        # Calculate settlement times based on actual intervals
+        # Binance: 0, 8, 16 UTC (8h interval)
+        # Bybit: 0, 4, 8, 12, 16, 20 UTC (4h interval)
+        # etc.
+        hour_utc = time_grid.hour.to_numpy()[covered]
+        binance_pay = (hour_utc % bn_hours == 0)  # Settlement every bn_hours
+        bybit_pay = (hour_utc % by_hours == 0)    # Settlement every by_hours
+        
+        # Calculate tradable opportunity
+        # True if only one exchange is paying AND that exchange's rate > 16bp (0.0016)
+        only_binance_paying = binance_pay & ~bybit_pay
+        only_bybit_paying = bybit_pay & ~binance_pay
+        
+        binance_rate_bp = np.abs(bn_rate) * 10000  # Convert to basis points
+        bybit_rate_bp = np.abs(by_rate) * 10000
+        
+        tradable = (
+            (only_binance_paying & (binance_rate_bp > 16)) |
+            (only_bybit_paying & (bybit_rate_bp > 16))
         )
         
-        data = []
-        for dt in time_grid:
-            t = int(dt.timestamp() * 1000)
-            bn_interval, bn_rate = self.get_interval_at_time(binance_timeline, t)
-            by_interval, by_rate = self.get_interval_at_time(bybit_timeline, t)
-            
-            if bn_interval is not None and by_interval is not None:
-                # Check if there's a mismatch
-                interval_diff = abs(bn_interval - by_interval)
-                is_mismatch = interval_diff >= self.mismatch_threshold
-                
-                # Convert intervals to hours
-                bn_hours = round(bn_interval / 3600)
-                by_hours = round(by_interval / 3600)
-                
-                # Calculate settlement times based on actual intervals
-                # Binance: 0, 8, 16 UTC (8h interval)
-                # Bybit: 0, 4, 8, 12, 16, 20 UTC (4h interval)
-                # etc.
-                hour_utc = dt.hour
-                binance_pay = (hour_utc % bn_hours == 0)  # Settlement every bn_hours
-                bybit_pay = (hour_utc % by_hours == 0)    # Settlement every by_hours
-                
-                # Calculate tradable opportunity
-                # True if only one exchange is paying AND that exchange's rate > 16bp (0.0016)
-                only_binance_paying = binance_pay and not bybit_pay
-                only_bybit_paying = bybit_pay and not binance_pay
-                
-                binance_rate_bp = abs(bn_rate) * 10000 if bn_rate else 0  # Convert to basis points
-                bybit_rate_bp = abs(by_rate) * 10000 if by_rate else 0
-                
-                tradable = False
-                if only_binance_paying and binance_rate_bp > 16:
-                    tradable = True
-                elif only_bybit_paying and bybit_rate_bp > 16:
-                    tradable = True
-                
-                data.append({
-                    'datetime': dt,
-                    'binance_interval': bn_hours,
-                    'bybit_interval': by_hours,
-                    'interval_diff': abs(bn_hours - by_hours),
-                    'binance_rate': bn_rate,
-                    'bybit_rate': by_rate,
-                    'rate_diff': bn_rate - by_rate,
-                    'is_mismatch': is_mismatch,
-                    'mismatch_type': f"{bn_hours}h_vs_{by_hours}h" if is_mismatch else 'match',
-                    'binance_pay': binance_pay,
-                    'bybit_pay': bybit_pay,
-                    'tradable': tradable
-                })
-        
-        return pd.DataFrame(data)
+        mismatch_type = np.where(
+            is_mismatch,
+            np.char.add(np.char.add(bn_hours.astype(str), 'h_vs_'), np.char.add(by_hours.astype(str), 'h')),
+            'match'
+        ).astype(object)
+        
+        return pd.DataFrame({
+            'datetime': time_grid[covered],
+            'binance_interval': bn_hours,
+            'bybit_interval': by_hours,
+            'interval_diff': np.abs(bn_hours - by_hours),
+            'binance_rate': bn_rate,
+            'bybit_rate': by_rate,
+            'rate_diff': bn_rate - by_rate,
+            'is_mismatch': is_mismatch,
+            'mismatch_type': mismatch_type,
+            'binance_pay': binance_pay,
+            'bybit_pay': bybit_pay,
+            'tradable': tradable
+        })
     
     def create_interval_matrix(
         self,
-        binance_timeline: List[Dict[str, Any]],
-        bybit_timeline: List[Dict[str, Any]],
+        binance_timeline: Dict[str, np.ndarray],
+        bybit_timeline: Dict[str, np.ndarray],
         start_time: int,
-        end_time: int
-    ) -> pd.DataFrame:
+        end_time: int,
+        grid: Optional[HourlyGrid] = None
+    ) -> np.ndarray:
         """
-        Create a time-series matrix of intervals for heatmap visualization.
+        Create one row of the interval matrix for heatmap visualization.
+        
+        The row has one int8 slot per hour of hourly_grid(start_time, end_time)
+        holding the absolute interval difference in hours, or -1 where either
+        exchange has no active interval.
+        
+        Args:
+            binance_timeline: Binance interval timeline
+            bybit_timeline: Bybit interval timeline
+            start_time: Analysis start time (ms)
+            end_time: Analysis end time (ms)
+            grid: Optional hourly_grid_ms(start_time, end_time), built here if omitted
         
         Returns:
-            DataFrame with timestamps as index and interval differences
+            int8 array of interval differences (hours) per hourly slot
         """
-        # Create hourly time grid
-        time_grid = pd.date_range(
-            start=timestamp_to_datetime(start_time),
-            end=timestamp_to_datetime(end_time),
-            freq='h'
-        )
+        # Hourly time grid
+        if grid is None:
+            grid = self.hourly_grid_ms(start_time, end_time)
+        grid_ms = grid.ms
         
-        data = []
-        for dt in time_grid:
-            t = int(dt.timestamp() * 1000)
-            bn_interval, _ = self.get_interval_at_time(binance_timeline, t)
-            by_interval, _ = self.get_interval_at_time(bybit_timeline, t)
-            
-            if bn_interval is not None and by_interval is not None:
-                # Convert intervals to hours (intervals are in seconds)
-                bn_hours = round(bn_interval / 3600)
-                by_hours = round(by_interval / 3600)
-                diff_hours = abs(bn_hours - by_hours)
-                data.append({
-                    'datetime': dt,
-                    'binance_interval': bn_hours,
-                    'bybit_interval': by_hours,
-                    'interval_diff': diff_hours
-                })
-        
-        return pd.DataFrame(data)
+        bn_interval = self.lookup_intervals(binance_timeline, grid_ms)['interval']
+        by_interval = self.lookup_intervals(bybit_timeline, grid_ms)['interval']
+        covered = ~np.isnan(bn_interval) & ~np.isnan(by_interval)
+        
+        # Convert intervals to hours (intervals are in seconds)
+        bn_hours = np.round(bn_interval[covered] / 3600).astype(np.int64)
+        by_hours = np.round(by_interval[covered] / 3600).astype(np.int64)
+        
+        row = np.full(len(grid_ms), -1, dtype=np.int8)
+        row[covered] = np.abs(bn_hours - by_hours)
+        return row
     
     def validate_data_quality(
         self,
-        funding_data: List[Dict[str, Any]],
+        funding_data: Union[List[Dict[str, Any]], Dict[str, np.ndarray]],
         expected_interval: int,
         start_time: int,
         end_time: int
@@ -287,7 +380,7 @@ class IntervalAnalyzer:
         Validate data quality and completeness.
         
         Args:
-            funding_data: Funding rate records
+            funding_data: Funding rate records or arrays from to_funding_arrays
             expected_interval: Expected funding interval in seconds
             start_time: Analysis start time
             end_time: Analysis end time
@@ -295,7 +388,11 @@ class IntervalAnalyzer:
         Returns:
             Dictionary with quality metrics
         """
-        if not funding_data:
+        arrays = self.to_funding_arrays(funding_data)
+        funding_time = arrays['fundingTime']
+        funding_rate = arrays['fundingRate']
+        
+        if len(funding_time) == 0:
             return {
                 'is_valid': False,
                 'completeness': 0.0,
@@ -306,7 +403,7 @@ class IntervalAnalyzer:
         
         # Calculate expected number of records
         time_range = (end_time - start_time) / 1000  # in seconds
-        actual_records = len(funding_data)
+        actual_records = len(funding_time)
         
         # For very small time ranges (< 1 interval), calculate completeness differently
         # to avoid unrealistic percentages
@@ -322,15 +419,19 @@ class IntervalAnalyzer:
         completeness = min(completeness, 1.0)
         
         # Check for large time gaps
-        for i in range(1, len(funding_data)):
-            gap = (funding_data[i]['fundingTime'] - funding_data[i-1]['fundingTime']) / 1000
-            if gap > 86400:  # 24 hours
-                issues.append(f"Large time gap: {gap/3600:.1f}h at {funding_data[i]['datetime']}")
+        gaps = np.diff(funding_time) / 1000
+        for i in np.flatnonzero(gaps > 86400):  # 24 hours
+            issues.append(
+                f"Large time gap: {gaps[i]/3600:.1f}h at "
+                f"{timestamp_to_datetime(int(funding_time[i + 1])).isoformat()}"
+            )
         
         # Check funding rate validity
-        for record in funding_data:
-            if abs(record['fundingRate']) > 0.005:  # ±0.5%
-                issues.append(f"Unusual funding rate: {record['fundingRate']:.4f} at {record['datetime']}")
+        for i in np.flatnonzero(np.abs(funding_rate) > 0.005):  # ±0.5%
+            issues.append(
+                f"Unusual funding rate: {funding_rate[i]:.4f} at "
+                f"{timestamp_to_datetime(int(funding_time[i])).isoformat()}"
+            )
         
         return {
             'is_valid': completeness >= 0.8 and len(issues) < 5,
@@ -339,4 +440,3 @@ class IntervalAnalyzer:
             'actual_records': actual_records,
             'issues': issues[:10]  # Limit to first 10 issues
         }
-
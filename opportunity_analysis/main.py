@@ -3,7 +3,9 @@ import asyncio
 import logging
 import json
 import argparse
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -16,12 +18,12 @@ sys.path.insert(0, '/home/james/research/funding_interval_arb')
 
 from opportunity_analysis.config import (
     ANALYSIS_DAYS, OUTPUT_DIR, DATA_DIR, PLOTS_DIR,
-    VALID_INTERVALS
+    VALID_INTERVALS, MIN_ANALYSIS_RECORDS
 )
 from data_collector.utils import get_time_range, create_symbol_mapping, get_all_symbols_from_exchanges
 from data_collector.binance_client import BinanceClient
 from data_collector.bybit_client import BybitClient
-from opportunity_analysis.interval_analyzer import IntervalAnalyzer
+from opportunity_analysis.interval_analyzer import IntervalAnalyzer, HourlyGrid
 from opportunity_analysis.stats_analyzer import StatisticsAnalyzer
 from opportunity_analysis.visualizer import Visualizer
 
@@ -36,6 +38,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _available_cpus() -> int:
+    """
+    Number of CPUs this process may run on.
+    
+    Uses the scheduler affinity mask so container/cgroup CPU limits are
+    respected; falls back to os.cpu_count() where affinity is unavailable.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 64
+
+
 class PerformanceMonitor:
     """
     Ticket #8: Performance monitoring and statistics.
@@ -803,10 +818,27 @@ async def phase1b_fetch_bybit_parallel(
     return bybit_results
 
 
+# Phase 1C worker context, installed once per process by _init_phase1c_worker
+_PHASE1C_GRID: Optional[HourlyGrid] = None
+
+
+def _init_phase1c_worker(grid: HourlyGrid) -> None:
+    """
+    Process pool initializer for Phase 1C.
+    
+    Installs the run's hourly grid once per worker process, so it is not
+    pickled with every per-symbol task.
+    """
+    global _PHASE1C_GRID
+    _PHASE1C_GRID = grid
+
+
 def _process_symbol_for_phase1c(args: tuple) -> tuple:
     """
     Worker function for Phase 1C symbol processing (multiprocessing-compatible).
     
+    Uses the hourly grid installed by _init_phase1c_worker, if any.
+    
     Args:
         args: Tuple of (symbol, bn_data, by_data, analyzer, start_time, end_time)
     
@@ -820,13 +852,17 @@ def _process_symbol_for_phase1c(args: tuple) -> tuple:
         if not bn_data or not by_data:
             return symbol, None
         
+        # Store records as columnar arrays so Phase 2 never re-converts them
+        bn_data = analyzer.to_funding_arrays(bn_data)
+        by_data = analyzer.to_funding_arrays(by_data)
+        
         # Create timelines (no API calls, just local computation)
         bn_timeline = analyzer.create_interval_timeline(bn_data)
         by_timeline = analyzer.create_interval_timeline(by_data)
         
         # Create funding rate timeline with tradable info
         funding_timeline = analyzer.create_funding_rate_timeline(
-            bn_timeline, by_timeline, start_time, end_time
+            bn_timeline, by_timeline, start_time, end_time, grid=_PHASE1C_GRID
         )
         
         # Return preloaded data
@@ -870,7 +906,6 @@ def phase1c_merge_and_generate_timelines(
     Returns:
         Dict mapping symbols to preloaded data
     """
-    import os
     from multiprocessing import Pool
     
     logger.info("="*70)
@@ -895,10 +930,13 @@ def phase1c_merge_and_generate_timelines(
     fail_count = len(symbols) - len(symbols_to_process)
     
     # Calculate actual number of workers
-    actual_workers = min(num_workers, len(symbols_to_process), os.cpu_count() or 64)
+    actual_workers = min(num_workers, len(symbols_to_process), _available_cpus())
+    
+    # The hourly grid is shared by all symbols: built once, installed per worker
+    grid = analyzer.hourly_grid_ms(start_time, end_time)
     
     try:
-        with Pool(processes=actual_workers) as pool:
+        with Pool(processes=actual_workers, initializer=_init_phase1c_worker, initargs=(grid,)) as pool:
             results = pool.map(_process_symbol_for_phase1c, symbols_to_process)
         
         for symbol, result in results:
@@ -913,6 +951,7 @@ def phase1c_merge_and_generate_timelines(
         logger.info("[Phase 1C] Falling back to sequential processing...")
         
         # Fallback to sequential processing
+        _init_phase1c_worker(grid)
         for symbol, bn_data, by_data, analyzer_arg, start_time_arg, end_time_arg in symbols_to_process:
             symbol_result, data = _process_symbol_for_phase1c(
                 (symbol, bn_data, by_data, analyzer, start_time, end_time)
@@ -1054,43 +1093,12 @@ async def phase1_preload_data(
     return preloaded_data
 
 
-def _generate_timeline_plot_worker(args: tuple) -> tuple:
-    """
-    Worker function for generating timeline plots in parallel.
-    
-    This function is designed to work with multiprocessing.
-    It takes a tuple of (symbol, timeline_df) and generates a plot.
-    
-    Args:
-        args: Tuple of (symbol, timeline_df)
-    
-    Returns:
-        Tuple of (symbol, success: bool, message: str)
-    """
-    import matplotlib
-    matplotlib.use('Agg')  # Use non-interactive backend for multiprocessing
-    
-    symbol, timeline_df = args
-    
-    try:
-        if timeline_df.empty:
-            return (symbol, False, f"Empty timeline for {symbol}")
-        
-        # Import here to avoid issues with pickling
-        from opportunity_analysis.visualizer import Visualizer
-        
-        visualizer = Visualizer()
-        visualizer.plot_timeline_from_df(timeline_df, symbol)
-        
-        return (symbol, True, f"✓ Generated timeline for {symbol}")
-    except Exception as e:
-        return (symbol, False, f"✗ Failed for {symbol}: {str(e)}")
-
-
 async def phase3_postprocess(
     all_results: List[Dict[str, Any]],
     all_mismatches: List[Dict[str, Any]],
-    interval_matrices: Dict[str, pd.DataFrame],
+    interval_matrix: np.ndarray,
+    matrix_symbols: List[str],
+    slot_times: pd.DatetimeIndex,
     stats_analyzer: StatisticsAnalyzer,
     visualizer: Visualizer,
     start_time: int,
@@ -1110,7 +1118,9 @@ async def phase3_postprocess(
     Args:
         all_results: List of analysis results from Phase 2
         all_mismatches: List of all mismatch events found
-        interval_matrices: Dict of interval matrices per symbol
+        interval_matrix: int8 interval-difference matrix (n_symbols, n_slots)
+        matrix_symbols: Symbol for each matrix row
+        slot_times: Datetime for each matrix column
         stats_analyzer: StatisticsAnalyzer instance
         visualizer: Visualizer instance
         start_time: Analysis start time (ms)
@@ -1216,12 +1226,13 @@ async def phase3_postprocess(
         tables_created += 1
         
         # Symbol funding rates
-        df = stats['dataframe']
-        symbol_funding = df.groupby('symbol').agg({
-            'avg_binance_rate': 'mean',
-            'avg_bybit_rate': 'mean',
-            'duration_hours': ['count', 'sum', 'mean']
-        }).round(6)
+        symbol_funding = stats.symbol_agg[[
+            'avg_binance_rate',
+            'avg_bybit_rate',
+            'event_count',
+            'total_duration',
+            'mean_duration'
+        ]].round(6)
         
         symbol_funding.columns = [
             'Avg Binance Rate',
@@ -1261,29 +1272,17 @@ async def phase3_postprocess(
     
     plots_created = 0
     if stats['total_events'] > 0:
-        # Heatmap
-        visualizer.plot_heatmap(interval_matrices, top_n=20)
-        plots_created += 1
-        
-        # Duration histogram
-        visualizer.plot_duration_histogram(stats)
-        plots_created += 1
-        
-        # Symbol ranking
-        visualizer.plot_symbol_ranking(stats, top_n=20)
-        plots_created += 1
-        
-        # Mismatch type distribution
-        visualizer.plot_mismatch_type_distribution(stats)
-        plots_created += 1
-        
-        # Tradable opportunities by hour
-        visualizer.plot_tradable_opportunities(all_results)
-        plots_created += 1
-        
-        # Tradable average funding rate by symbol
-        visualizer.plot_tradable_avg_funding_by_symbol(all_results)
-        plots_created += 1
+        # Summary charts are independent of each other: render them in parallel
+        charts = [
+            ('plot_heatmap', (interval_matrix, matrix_symbols, slot_times), {'top_n': 20}),
+            ('plot_duration_histogram', (stats,), {}),
+            ('plot_symbol_ranking', (stats,), {'top_n': 20}),
+            ('plot_mismatch_type_distribution', (stats,), {}),
+            ('plot_tradable_opportunities', (all_results,), {}),  # Tradable opportunities by hour
+            ('plot_tradable_avg_funding_by_symbol', (all_results,), {}),
+        ]
+        chart_paths = visualizer.plot_charts_parallel(charts, max_workers=min(len(charts), _available_cpus()))
+        plots_created += sum(1 for path in chart_paths if path)
         
         # Timeline for all symbols with mismatch events
         # 🚀 OPTIMIZED: Use multiprocessing for parallel timeline generation
@@ -1292,47 +1291,31 @@ async def phase3_postprocess(
         
         if len(symbols_with_mismatches) > 0:
             # Prepare data for multiprocessing
-            plot_tasks = []
+            timeline_dfs = {}
             for symbol in symbols_with_mismatches:
                 result = next((r for r in all_results if r['symbol'] == symbol), None)
                 if result and not result['funding_rate_timeline'].empty:
-                    plot_tasks.append((symbol, result['funding_rate_timeline']))
+                    timeline_dfs[symbol] = result['funding_rate_timeline']
             
-            if plot_tasks:
-                # Use multiprocessing for parallel timeline generation
-                import os
-                from multiprocessing import Pool
+            if timeline_dfs:
+                num_workers = min(64, len(timeline_dfs), _available_cpus())
+                logger.info(f"[Post-process] Generating {len(timeline_dfs)} timelines using {num_workers} workers...")
                 
-                num_workers = min(64, len(plot_tasks), os.cpu_count() or 64)
-                logger.info(f"[Post-process] Generating {len(plot_tasks)} timelines using {num_workers} workers...")
+                results = visualizer.plot_timelines_parallel(timeline_dfs, max_workers=num_workers)
                 
-                try:
-                    with Pool(processes=num_workers) as pool:
-                        results = pool.map(_generate_timeline_plot_worker, plot_tasks)
-                    
-                    # Log results
-                    success_count = sum(1 for _, success, _ in results if success)
-                    for symbol, success, message in results:
-                        if not success:
-                            logger.warning(f"[Post-process] {message}")
-                        elif (symbols_with_mismatches.index(symbol) + 1) % 10 == 0 or symbols_with_mismatches.index(symbol) == len(symbols_with_mismatches) - 1:
-                            logger.info(f"[Post-process]   {message}")
-                    
-                    logger.info(f"[Post-process] Successfully generated {success_count}/{len(plot_tasks)} timeline plots")
+                # Log results
+                success_count = sum(1 for _, success, _ in results if success)
+                for symbol, success, message in results:
+                    if not success:
+                        logger.warning(f"[Post-process] {message}")
+                    elif (symbols_with_mismatches.index(symbol) + 1) % 10 == 0 or symbols_with_mismatches.index(symbol) == len(symbols_with_mismatches) - 1:
+                        logger.info(f"[Post-process]   {message}")
                 
-                except Exception as e:
-                    logger.error(f"[Post-process] Multiprocessing failed, falling back to sequential: {e}")
-                    # Fallback to sequential execution
-                    for idx, (symbol, timeline_df) in enumerate(plot_tasks, 1):
-                        try:
-                            visualizer.plot_timeline_from_df(timeline_df, symbol)
-                            if idx % 10 == 0:
-                                logger.info(f"[Post-process]   Generated timeline plots for {idx}/{len(plot_tasks)} symbols")
-                        except Exception as e:
-                            logger.warning(f"[Post-process] Failed to generate timeline for {symbol}: {e}")
+                logger.info(f"[Post-process] Successfully generated {success_count}/{len(timeline_dfs)} timeline plots")
         
         plots_created += len(symbols_with_mismatches)
         logger.info(f"[Post-process] Created {plots_created} plots/timelines in total")
+        visualizer.close()
     
     # Phase 3E: Save metadata
     logger.info("[Post-process] Saving metadata...")
@@ -1376,7 +1359,8 @@ def analyze_from_cache(
     preloaded: Dict[str, Any],
     analyzer: IntervalAnalyzer,
     start_time: int,
-    end_time: int
+    end_time: int,
+    grid: Optional[HourlyGrid] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Phase 2A: Analyze a single symbol using preloaded data (no API calls).
@@ -1391,18 +1375,20 @@ def analyze_from_cache(
         symbol: Trading symbol to analyze
         preloaded: Dict containing preloaded data for this symbol:
                    {
-                       'bn_data': [...],
-                       'by_data': [...],
-                       'bn_timeline': pd.DataFrame(),
-                       'by_timeline': pd.DataFrame(),
+                       'bn_data': {'fundingTime': ndarray, ...},
+                       'by_data': {'fundingTime': ndarray, ...},
+                       'bn_timeline': {'start': ndarray, ...},
+                       'by_timeline': {'start': ndarray, ...},
                        'funding_timeline': pd.DataFrame()
                    }
         analyzer: IntervalAnalyzer instance
         start_time: Analysis start time (ms)
         end_time: Analysis end time (ms)
+        grid: Optional analyzer.hourly_grid_ms(start_time, end_time), shared across symbols
     
     Returns:
-        Dictionary with analysis results or None if analysis fails
+        Dictionary with analysis results (flagged 'skipped' when either side has
+        fewer than MIN_ANALYSIS_RECORDS funding records) or None if analysis fails
     """
     try:
         # Extract preloaded data
@@ -1412,7 +1398,7 @@ def analyze_from_cache(
         by_timeline = preloaded.get('by_timeline')
         funding_timeline = preloaded.get('funding_timeline')
         
-        # Validate data quality (pass lists, not DataFrames)
+        # Validate data quality (columnar arrays from Phase 1C)
         bn_quality = analyzer.validate_data_quality(
             bn_data,
             expected_interval=28800,  # Default 8h
@@ -1434,6 +1420,22 @@ def analyze_from_cache(
             )
             # Continue anyway, log the issues but don't fail
         
+        # Early exit: a side with fewer than two records has no interval periods, so
+        # nothing can be derived. Completeness is not used: it is measured against the
+        # whole window, and a recent listing with full data since listing scores low.
+        if (bn_quality.get('actual_records', 0) < MIN_ANALYSIS_RECORDS
+                or by_quality.get('actual_records', 0) < MIN_ANALYSIS_RECORDS):
+            logger.warning(f"[Analysis] {symbol}: skipped, insufficient data")
+            return {
+                'symbol': symbol,
+                'skipped': True,
+                'mismatches': [],
+                'data_quality': {
+                    'binance': bn_quality,
+                    'bybit': by_quality
+                }
+            }
+        
         # Detect mismatches
         mismatches = analyzer.detect_mismatches(
             bn_timeline,
@@ -1448,7 +1450,8 @@ def analyze_from_cache(
             bn_timeline,
             by_timeline,
             start_time,
-            end_time
+            end_time,
+            grid=grid
         )
         
         return {
@@ -1469,23 +1472,76 @@ def analyze_from_cache(
         return None
 
 
+# Phase 2 worker context, installed once per process by _init_phase2_worker
+_ANALYZER: Optional[IntervalAnalyzer] = None
+_START: Optional[int] = None
+_END: Optional[int] = None
+_GRID: Optional[HourlyGrid] = None
+
+
+def _init_phase2_worker(
+    analyzer: IntervalAnalyzer,
+    start_time: int,
+    end_time: int
+) -> None:
+    """
+    Process pool initializer for Phase 2.
+    
+    Installs the analyzer, analysis window and its hourly grid into module
+    globals once per worker process, so they are not rebuilt or pickled
+    with every task.
+    
+    Args:
+        analyzer: IntervalAnalyzer instance
+        start_time: Analysis start time (ms)
+        end_time: Analysis end time (ms)
+    """
+    global _ANALYZER, _START, _END, _GRID
+    _ANALYZER, _START, _END = analyzer, start_time, end_time
+    _GRID = analyzer.hourly_grid_ms(start_time, end_time)
+
+
+def _analyze_symbols_chunk(chunk: List[tuple]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Worker function for Phase 2: analyze a chunk of (symbol, preloaded) pairs.
+    
+    Requires the pool to be created with _init_phase2_worker.
+    
+    Args:
+        chunk: List of (symbol, preloaded_data) tuples
+    
+    Returns:
+        List of analysis results in chunk order
+    """
+    return [
+        analyze_from_cache(symbol, preloaded, _ANALYZER, _START, _END, _GRID)
+        for symbol, preloaded in chunk
+    ]
+
+
 def phase2_analyze_batch(
     symbols_batch: List[str],
     preloaded_data: Dict[str, Dict[str, Any]],
     analyzer: IntervalAnalyzer,
     start_time: int,
     end_time: int,
+    executor: ProcessPoolExecutor,
     num_workers: int = 64
 ) -> tuple[List[Optional[Dict[str, Any]]], int]:
     """
     Phase 2B: Parallel analysis of a batch of symbols using preloaded data.
     
-    This function takes a batch of symbols and analyzes them in parallel
-    using multiprocessing.Pool (NOT async). No API calls are made - all 
-    data was preloaded in Phase 1.
+    This function takes a batch of symbols (main() passes all of them in one
+    call) and analyzes them in parallel on a process pool owned by the
+    caller (NOT async). No API calls are made - all data was preloaded in
+    Phase 1.
     
     🚀 OPTIMIZATION: Uses multiprocessing instead of async because all
-    analysis operations are CPU-bound (pandas, logic, no I/O).
+    analysis operations are CPU-bound (pandas, logic, no I/O). The pool is
+    created once in main(), and symbols are sent in chunks of
+    ~len/(workers*4) to amortize per-task IPC. All chunks are submitted up
+    front: a pending chunk only references preloaded_data, which is already
+    resident, and the executor pickles just max_workers + 1 calls ahead.
     
     Implements FAST-SKIP logic: symbols not in preloaded_data are quickly
     skipped without attempting analysis. This saves time and prevents
@@ -1494,18 +1550,15 @@ def phase2_analyze_batch(
     Args:
         symbols_batch: List of symbols to analyze in this batch
         preloaded_data: Dict mapping symbols to their preloaded data
-        analyzer: IntervalAnalyzer instance
+        analyzer: IntervalAnalyzer instance (used by the sequential fallback)
         start_time: Analysis start time (ms)
         end_time: Analysis end time (ms)
-        num_workers: Number of CPU workers for multiprocessing (default: 64)
+        executor: Shared process pool, initialized with _init_phase2_worker
+        num_workers: Number of CPU workers in the pool (default: 64)
     
     Returns:
         Tuple of (analysis_results, skipped_count)
     """
-    from multiprocessing import Pool
-    from functools import partial
-    import os
-    
     # ========================================================================
     # FAST-SKIP Logic: Ticket #7
     # ========================================================================
@@ -1529,37 +1582,27 @@ def phase2_analyze_batch(
     logger.info(f"[Phase 2] Analyzing {len(valid_symbols)}/{len(symbols_batch)} symbols "
                 f"({len(skipped_symbols)} skipped) with {num_workers} CPU workers")
     
-    # Determine optimal number of workers
-    actual_workers = min(num_workers, len(valid_symbols), os.cpu_count() or 64)
+    # ~4 chunks per worker: amortizes IPC per task while keeping load balanced
+    chunksize = max(1, len(valid_symbols) // (num_workers * 4))
     
-    # Create worker function with partial application
-    worker_fn = partial(
-        analyze_from_cache,
-        analyzer=analyzer,
-        start_time=start_time,
-        end_time=end_time
+    chunks = (
+        [(symbol, preloaded_data[symbol]) for symbol in valid_symbols[i:i+chunksize]]
+        for i in range(0, len(valid_symbols), chunksize)
     )
     
-    # Execute analysis in parallel using multiprocessing
     try:
-        with Pool(processes=actual_workers) as pool:
-            results = []
-            for symbol in valid_symbols:
-                # Pass symbol and its preloaded data
-                result = pool.apply_async(
-                    analyze_from_cache,
-                    (symbol, preloaded_data[symbol], analyzer, start_time, end_time)
-                )
-                results.append(result)
-            
-            # Collect results in order
-            analysis_results = [r.get() for r in results]
+        analysis_results = [
+            result
+            for chunk_results in executor.map(_analyze_symbols_chunk, chunks)
+            for result in chunk_results
+        ]
     except Exception as e:
         logger.error(f"[Phase 2] Multiprocessing error: {e}", exc_info=True)
         # Fallback to sequential execution
         logger.warning("[Phase 2] Falling back to sequential analysis")
+        grid = analyzer.hourly_grid_ms(start_time, end_time)
         analysis_results = [
-            analyze_from_cache(symbol, preloaded_data[symbol], analyzer, start_time, end_time)
+            analyze_from_cache(symbol, preloaded_data[symbol], analyzer, start_time, end_time, grid)
             for symbol in valid_symbols
         ]
     
@@ -1666,7 +1709,16 @@ async def analyze_symbol(
 
 
 async def main():
-    """Main analysis workflow with performance monitoring (Ticket #8)."""
+    """
+    Main analysis workflow with performance monitoring (Ticket #8).
+    
+    Work is split by bottleneck:
+    - Phase 1A/1B (I/O-bound): API/cache fetches run concurrently on the
+      event loop via asyncio.gather, bounded by a Semaphore per exchange
+    - Phase 1C, Phase 2 (CPU-bound): timeline building and mismatch analysis
+      run in worker processes, with no artificial pacing
+    - Phase 3: saving, reporting and plotting (plots in worker processes)
+    """
     # Initialize performance monitor (Ticket #8)
     perf_monitor = PerformanceMonitor()
     
@@ -1726,57 +1778,63 @@ async def main():
     
     all_results = []
     all_mismatches = []
-    interval_matrices = {}
-    total_skipped = 0  # Track fast-skipped symbols (Ticket #7)
+    
+    # Heatmap input: one int8 row per symbol, one column per hourly slot
+    # (-1 where either exchange has no active interval)
+    slot_times = interval_analyzer.hourly_grid(start_time, end_time)
+    interval_matrix = np.full((len(symbols), len(slot_times)), -1, dtype=np.int8)
+    symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
     
     perf_monitor.start_phase2()
     
-    # Process symbols in batches for parallel analysis
-    # Batch size can be larger now since no API calls are made
-    batch_size = 20 if len(symbols) > 50 else 10
-    num_batches = (len(symbols) - 1) // batch_size + 1
+    # All symbols go to the pool in one submission; chunking is done in
+    # phase2_analyze_batch so each worker gets several symbols per task
+    num_workers = min(64, _available_cpus())
     
-    for batch_idx in range(0, len(symbols), batch_size):
-        batch = symbols[batch_idx:batch_idx+batch_size]
-        current_batch_num = batch_idx // batch_size + 1
-        
-        logger.info(f"[Phase 2] Batch {current_batch_num}/{num_batches}: Processing {len(batch)} symbols in parallel...")
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=_init_phase2_worker,
+        initargs=(interval_analyzer, start_time, end_time)
+    ) as executor:
+        logger.info(f"[Phase 2] Processing {len(symbols)} symbols in parallel...")
         
-        # Analyze batch in parallel (returns tuple: (results, skipped_count))
         # 🚀 Using multiprocessing now (NOT async) for CPU-bound analysis
-        batch_results, batch_skipped = phase2_analyze_batch(
-            batch,
+        phase2_results, total_skipped = phase2_analyze_batch(
+            symbols,
             preloaded_data,
             interval_analyzer,
             start_time,
-            end_time
+            end_time,
+            executor,
+            num_workers
         )
-        
-        total_skipped += batch_skipped
-        
-        # Aggregate results
-        for result in batch_results:
-            if result:
-                all_results.append(result)
-                all_mismatches.extend(result['mismatches'])
-                if not result['interval_matrix'].empty:
-                    interval_matrices[result['symbol']] = result['interval_matrix']
-        
-        # Small delay between batches to avoid memory bloat (now using time.sleep instead of await)
-        time.sleep(0.5)  # Reduced from 1s since multiprocessing is faster
+    
+    # Aggregate results
+    no_data_skipped = 0
+    for result in phase2_results:
+        if result:
+            if result.get('skipped'):
+                no_data_skipped += 1
+                continue
+            all_results.append(result)
+            all_mismatches.extend(result['mismatches'])
+            row = interval_matrix[symbol_index[result['symbol']]]
+            row[:] = result['interval_matrix']
+            result['interval_matrix'] = row
     
     logger.info("="*70)
     logger.info(f"Phase 2 Summary:")
     logger.info(f"  Total results: {len(all_results)}")
     logger.info(f"  Total mismatch events: {len(all_mismatches)}")
     logger.info(f"  Fast-skipped symbols (Ticket #7): {total_skipped}")
+    logger.info(f"  Insufficient-data skipped symbols: {no_data_skipped}")
     logger.info("="*70)
     
     # Phase 2 performance tracking (Ticket #8)
     perf_monitor.end_phase2(
-        skipped_count=total_skipped,
+        skipped_count=total_skipped + no_data_skipped,
         analyzed_count=len(all_results),
-        failed_count=len(symbols) - len(all_results) - total_skipped
+        failed_count=len(symbols) - len(all_results) - total_skipped - no_data_skipped
     )
     
     # Phase 3: Post-processing (save, analyze, report, visualize)
@@ -1784,7 +1842,9 @@ async def main():
     phase3_result = await phase3_postprocess(
         all_results,
         all_mismatches,
-        interval_matrices,
+        interval_matrix,
+        symbols,
+        slot_times,
         stats_analyzer,
         visualizer,
         start_time,
@@ -1,5 +1,6 @@
 """Statistical analysis of mismatch events and tradable opportunities."""
 import logging
+from functools import cached_property
 from typing import List, Dict, Any
 import pandas as pd
 import numpy as np
@@ -14,6 +15,59 @@ from data_collector.utils import timestamp_to_datetime, format_duration
 logger = logging.getLogger(__name__)
 
 
+class MismatchStats(dict):
+    """
+    Statistics dictionary returned by analyze_mismatch_events.
+    
+    Behaves like the plain stats dict; the per-symbol, monthly and funding
+    rate aggregations of the event DataFrame are computed on first access
+    and cached, so report and table builders share one groupby each.
+    """
+    
+    def __init__(self, df: pd.DataFrame, stats: Dict[str, Any]):
+        super().__init__(stats)
+        self._df = df
+    
+    @cached_property
+    def symbol_agg(self) -> pd.DataFrame:
+        """Per-symbol event count, duration and mean funding rates."""
+        return self._df.groupby('symbol', observed=True).agg(
+            event_count=('duration_hours', 'count'),
+            total_duration=('duration_hours', 'sum'),
+            mean_duration=('duration_hours', 'mean'),
+            median_duration=('duration_hours', 'median'),
+            avg_binance_rate=('avg_binance_rate', 'mean'),
+            avg_bybit_rate=('avg_bybit_rate', 'mean')
+        )
+    
+    @cached_property
+    def monthly_agg(self) -> pd.DataFrame:
+        """Per-month event count, unique symbols and duration totals."""
+        month = self._df['start_datetime'].values.astype('datetime64[M]')
+        by_month = self._df.groupby(month)
+        return pd.DataFrame({
+            'events': by_month.size(),
+            'unique_symbols': by_month['symbol'].nunique(),
+            'sum_dur': by_month['duration_hours'].sum(),
+            'mean_dur': by_month['duration_hours'].mean()
+        }).rename_axis('month')
+    
+    @cached_property
+    def funding_summary(self) -> Dict[str, Dict[str, float]]:
+        """Funding rate statistics during mismatch, per exchange."""
+        summary = {}
+        for exchange, col in (('binance', 'avg_binance_rate'), ('bybit', 'avg_bybit_rate')):
+            rates = self._df[col]
+            summary[exchange] = {
+                'mean': rates.mean(),
+                'median': rates.median(),
+                'std': rates.std(),
+                'min': rates.min(),
+                'max': rates.max()
+            }
+        return summary
+
+
 class StatisticsAnalyzer:
     """Analyze statistics of interval mismatch events."""
     
@@ -23,7 +77,7 @@ class StatisticsAnalyzer:
     def analyze_mismatch_events(
         self,
         mismatch_events: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+    ) -> MismatchStats:
         """
         Perform comprehensive statistical analysis on mismatch events.
         
@@ -31,21 +85,24 @@ class StatisticsAnalyzer:
             mismatch_events: List of detected mismatch events
         
         Returns:
-            Dictionary containing various statistics
+            MismatchStats dictionary containing various statistics
         """
         if not mismatch_events:
             logger.warning("No mismatch events to analyze")
-            return {
+            return MismatchStats(pd.DataFrame(), {
                 'total_events': 0,
                 'total_symbols': 0,
                 'summary': 'No mismatch events found'
-            }
+            })
         
         df = pd.DataFrame(mismatch_events)
         
-        # Convert timestamps to datetime
-        df['start_datetime'] = pd.to_datetime(df['start_time'], unit='ms')
-        df['end_datetime'] = pd.to_datetime(df['end_time'], unit='ms')
+        # Categorical symbol: every groupby below keys on it
+        df['symbol'] = df['symbol'].astype('category')
+        df = df.drop(columns=['end_time'], errors='ignore')
+        
+        # Convert timestamps to datetime (cached: funding windows repeat across symbols)
+        df['start_datetime'] = pd.to_datetime(df['start_time'], unit='ms', cache=True)
         
         # Basic statistics
         total_events = len(df)
@@ -63,38 +120,14 @@ class StatisticsAnalyzer:
         }
         
         # Events per symbol
-        events_per_symbol = df.groupby('symbol').size().sort_values(ascending=False)
+        stats = MismatchStats(df, {'dataframe': df})
+        events_per_symbol = stats.symbol_agg['event_count'].sort_values(ascending=False)
         top_symbols = events_per_symbol.head(20).to_dict()
         all_symbols_with_mismatches = events_per_symbol.to_dict()  # 添加：所有有 mismatch 的 symbols
         
         # Mismatch type distribution
         mismatch_type_dist = df['mismatch_type'].value_counts().to_dict()
         
-        # Monthly statistics
-        df['month'] = df['start_datetime'].dt.to_period('M')
-        monthly_stats = df.groupby('month').agg({
-            'symbol': 'count',
-            'duration_hours': ['mean', 'sum']
-        }).to_dict()
-        
-        # Funding rate statistics during mismatch
-        funding_rate_stats = {
-            'binance': {
-                'mean': df['avg_binance_rate'].mean(),
-                'median': df['avg_binance_rate'].median(),
-                'std': df['avg_binance_rate'].std(),
-                'min': df['avg_binance_rate'].min(),
-                'max': df['avg_binance_rate'].max()
-            },
-            'bybit': {
-                'mean': df['avg_bybit_rate'].mean(),
-                'median': df['avg_bybit_rate'].median(),
-                'std': df['avg_bybit_rate'].std(),
-                'min': df['avg_bybit_rate'].min(),
-                'max': df['avg_bybit_rate'].max()
-            }
-        }
-        
         # Duration distribution buckets
         duration_buckets = {
             '<1h': len(df[df['duration_hours'] < 1]),
@@ -104,22 +137,20 @@ class StatisticsAnalyzer:
             '>24h': len(df[df['duration_hours'] >= 24])
         }
         
-        return {
+        stats.update({
             'total_events': total_events,
             'total_symbols': total_symbols,
             'duration_stats': duration_stats,
             'top_symbols': top_symbols,
             'all_symbols_with_mismatches': all_symbols_with_mismatches,  # 新增：所有有 mismatch 的 symbols
             'mismatch_type_distribution': mismatch_type_dist,
-            'monthly_stats': monthly_stats,
-            'funding_rate_stats': funding_rate_stats,
-            'duration_buckets': duration_buckets,
-            'dataframe': df
-        }
+            'duration_buckets': duration_buckets
+        })
+        return stats
     
     def create_summary_table(
         self,
-        stats: Dict[str, Any]
+        stats: MismatchStats
     ) -> pd.DataFrame:
         """
         Create a summary table of key statistics.
@@ -148,12 +179,12 @@ class StatisticsAnalyzer:
             ['  P75 Duration', f"{duration['p75']:.2f}", 'hours'],
             ['', '', ''],
             ['Funding Rate (Binance)', '', ''],
-            ['  Mean', f"{stats['funding_rate_stats']['binance']['mean']*10000:.2f}", 'bps'],
-            ['  Median', f"{stats['funding_rate_stats']['binance']['median']*10000:.2f}", 'bps'],
+            ['  Mean', f"{stats.funding_summary['binance']['mean']*10000:.2f}", 'bps'],
+            ['  Median', f"{stats.funding_summary['binance']['median']*10000:.2f}", 'bps'],
             ['', '', ''],
             ['Funding Rate (Bybit)', '', ''],
-            ['  Mean', f"{stats['funding_rate_stats']['bybit']['mean']*10000:.2f}", 'bps'],
-            ['  Median', f"{stats['funding_rate_stats']['bybit']['median']*10000:.2f}", 'bps'],
+            ['  Mean', f"{stats.funding_summary['bybit']['mean']*10000:.2f}", 'bps'],
+            ['  Median', f"{stats.funding_summary['bybit']['median']*10000:.2f}", 'bps'],
         ]
         
         df = pd.DataFrame(summary_data, columns=['Metric', 'Value', 'Unit'])
@@ -161,7 +192,7 @@ class StatisticsAnalyzer:
     
     def create_symbol_ranking_table(
         self,
-        stats: Dict[str, Any],
+        stats: MismatchStats,
         top_n: int = 20
     ) -> pd.DataFrame:
         """
@@ -177,14 +208,7 @@ class StatisticsAnalyzer:
         if stats['total_events'] == 0:
             return pd.DataFrame()
         
-        df = stats['dataframe']
-        
-        # Group by symbol and calculate statistics
-        symbol_stats = df.groupby('symbol').agg({
-            'duration_hours': ['count', 'sum', 'mean', 'median'],
-            'avg_binance_rate': 'mean',
-            'avg_bybit_rate': 'mean'
-        }).round(4)
+        symbol_stats = stats.symbol_agg.round(4)
         
         symbol_stats.columns = [
             'Event Count',
@@ -202,7 +226,7 @@ class StatisticsAnalyzer:
     
     def create_monthly_summary_table(
         self,
-        stats: Dict[str, Any]
+        stats: MismatchStats
     ) -> pd.DataFrame:
         """
         Create monthly summary statistics table.
@@ -216,12 +240,8 @@ class StatisticsAnalyzer:
         if stats['total_events'] == 0:
             return pd.DataFrame()
         
-        df = stats['dataframe']
-        
-        monthly = df.groupby('month').agg({
-            'symbol': ['count', 'nunique'],
-            'duration_hours': ['sum', 'mean']
-        }).round(2)
+        monthly = stats.monthly_agg.round(2)
+        monthly.index = monthly.index.strftime('%Y-%m')
         
         monthly.columns = [
             'Total Events',
@@ -234,7 +254,7 @@ class StatisticsAnalyzer:
     
     def generate_text_report(
         self,
-        stats: Dict[str, Any]
+        stats: MismatchStats
     ) -> str:
         """
         Generate a text report summarizing the analysis.
@@ -282,17 +302,13 @@ class StatisticsAnalyzer:
         for mtype, count in stats['mismatch_type_distribution'].items():
             report += f"  {mtype:20s} {count:4d} events\n"
         
-        # Calculate per-symbol funding rates
-        df = stats['dataframe']
-        symbol_funding = df.groupby('symbol').agg({
-            'avg_binance_rate': 'mean',
-            'avg_bybit_rate': 'mean'
-        }).sort_values('avg_binance_rate', ascending=False)
-        
-        # Calculate net funding (difference between exchanges)
-        symbol_funding['net_funding_bps'] = (symbol_funding['avg_binance_rate'] - symbol_funding['avg_bybit_rate']) * 10000
-        symbol_funding['avg_binance_bps'] = symbol_funding['avg_binance_rate'] * 10000
-        symbol_funding['avg_bybit_bps'] = symbol_funding['avg_bybit_rate'] * 10000
+        # Rank symbols by average Binance funding rate (descending)
+        symbol_agg = stats.symbol_agg
+        symbols = symbol_agg.index.to_numpy()
+        bn_bps = symbol_agg['avg_binance_rate'].to_numpy() * 10000
+        by_bps = symbol_agg['avg_bybit_rate'].to_numpy() * 10000
+        net_bps = bn_bps - by_bps
+        top_idx = np.argsort(-bn_bps, kind='stable')[:20]
         
         report += f"""
 💰 FUNDING RATE DURING MISMATCH (BY SYMBOL)
@@ -300,14 +316,16 @@ class StatisticsAnalyzer:
   Top 20 Symbols by Average Funding Rate:
   
 """
-        for i, (symbol, row) in enumerate(list(symbol_funding.head(20).iterrows()), 1):
-            report += f"  {i:2d}. {symbol:15s} BN: {row['avg_binance_bps']:7.2f} bps  |  BY: {row['avg_bybit_bps']:7.2f} bps  |  Net: {row['net_funding_bps']:7.2f} bps\n"
+        parts = []
+        for rank, i in enumerate(top_idx, 1):
+            parts.append(f"  {rank:2d}. {symbols[i]:15s} BN: {bn_bps[i]:7.2f} bps  |  BY: {by_bps[i]:7.2f} bps  |  Net: {net_bps[i]:7.2f} bps\n")
+        report += ''.join(parts)
         
         report += f"""
 📊 OVERALL EXCHANGE AVERAGES
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  Binance (mean):         {stats['funding_rate_stats']['binance']['mean']*10000:.2f} bps
-  Bybit (mean):           {stats['funding_rate_stats']['bybit']['mean']*10000:.2f} bps
+  Binance (mean):         {stats.funding_summary['binance']['mean']*10000:.2f} bps
+  Bybit (mean):           {stats.funding_summary['bybit']['mean']*10000:.2f} bps
 
 🏆 TOP 10 SYMBOLS BY FREQUENCY
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1,10 +1,20 @@
 """Visualization tools for interval mismatch analysis."""
+import gc
 import logging
-from typing import List, Dict, Any
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import List, Dict, Any, Optional
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Headless batch rendering; select before seaborn imports pyplot
+from matplotlib.artist import setp
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
+from PIL import Image
 from pathlib import Path
 from datetime import datetime
 import sys
@@ -12,89 +22,325 @@ import sys
 # Add funding_interval_arb directory to path
 sys.path.insert(0, '/home/james/research/funding_interval_arb')
 
-from opportunity_analysis.config import PLOTS_DIR
+from opportunity_analysis.config import PLOTS_DIR, FAST_PNG
+from opportunity_analysis.interval_analyzer import find_true_runs
 from data_collector.utils import timestamp_to_datetime
 
 logger = logging.getLogger(__name__)
 
 # Set style
 sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (14, 8)
-plt.rcParams['font.size'] = 10
+matplotlib.rcParams['figure.figsize'] = (14, 8)
+matplotlib.rcParams['font.size'] = 10
+matplotlib.rcParams['agg.path.chunksize'] = 10000  # stroke long timeline paths in chunks
+matplotlib.rcParams['font.family'] = 'DejaVu Sans'  # bundled font: no sans-serif fallback search
+
+# Heatmap colormap: green (0) -> yellow (1-3) -> red (>3), interpolated once
+_HEATMAP_CMAP = sns.blend_palette(['#2ecc71', '#f1c40f', '#e74c3c'], n_colors=100, as_cmap=True)
+
+# RdYlGn_r quantized once into an 8-color RGBA palette for the funding bar colors
+_FUNDING_BAR_LUT = matplotlib.colormaps['RdYlGn_r'](np.linspace(0, 1, 8))
+
+def _top_n_indices(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    Indices of the n largest values, descending, ties kept in input order.
+    
+    Partial selection: only values tied with or above the n-th largest are
+    sorted, instead of the whole array. Matches sorted(..., reverse=True)[:n].
+    """
+    if len(values) > n:
+        nth_largest = np.partition(values, len(values) - n)[len(values) - n]
+        candidates = np.flatnonzero(values >= nth_largest)
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(-values[candidates], kind='stable')[:n]]
+
+
+def _new_figure(**kwargs) -> Figure:
+    """
+    Create a Figure on its own Agg canvas, outside pyplot.
+    
+    pyplot's figure manager and current-figure stack are never touched, so
+    nothing needs plt.close() and figures can be released by dropping them.
+    """
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+_fonts_warmed = False
+
+
+def _warm_fonts() -> None:
+    """
+    Resolve and load the plot fonts once per process.
+    
+    The first text draw pays for the font-list load and font lookup. Doing it
+    up front in the parent means forked pool workers inherit the warm caches.
+    """
+    global _fonts_warmed
+    if _fonts_warmed:
+        return
+    fig = _new_figure(figsize=(1, 1))
+    fig.text(0, 0, 'warm', fontweight='bold')
+    fig.text(0, 0, 'warm')
+    fig.canvas.draw()
+    _fonts_warmed = True
+
+
+# Per-process Visualizer for timeline workers, so its timeline figure is reused across tasks
+_TIMELINE_VISUALIZER = None
+
+# Batch timeline rendering runs a full GC pass every this many plots
+_TIMELINE_GC_INTERVAL = 20
+_timeline_renders = 0
+
+
+def _timeline_task(visualizer: 'Visualizer', symbol: str, timeline_df: pd.DataFrame) -> tuple:
+    """
+    Render one timeline and report the outcome instead of raising.
+    
+    Matplotlib artists hold reference cycles, so a periodic gc.collect()
+    keeps RSS flat over long batches.
+    
+    Returns:
+        Tuple of (symbol, success: bool, message: str)
+    """
+    global _timeline_renders
+    try:
+        if timeline_df.empty:
+            return (symbol, False, f"Empty timeline for {symbol}")
+        visualizer.plot_timeline_from_df(timeline_df, symbol)
+        return (symbol, True, f"✓ Generated timeline for {symbol}")
+    except Exception as e:
+        return (symbol, False, f"✗ Failed for {symbol}: {str(e)}")
+    finally:
+        _timeline_renders += 1
+        if _timeline_renders % _TIMELINE_GC_INTERVAL == 0:
+            gc.collect()
+
+
+def _render_timeline_worker(args: tuple) -> tuple:
+    """
+    Process pool task for Visualizer.plot_timelines_parallel.
+    
+    Args:
+        args: Tuple of (output_dir, symbol, timeline_df)
+    
+    Returns:
+        Tuple of (symbol, success: bool, message: str)
+    """
+    global _TIMELINE_VISUALIZER
+    output_dir, symbol, timeline_df = args
+    if _TIMELINE_VISUALIZER is None or _TIMELINE_VISUALIZER.output_dir != output_dir:
+        if _TIMELINE_VISUALIZER is not None:
+            _TIMELINE_VISUALIZER.close()
+        _TIMELINE_VISUALIZER = Visualizer(output_dir)
+    return _timeline_task(_TIMELINE_VISUALIZER, symbol, timeline_df)
+
+
+def _render_timeline_chunk(tasks: List[tuple]) -> List[tuple]:
+    """Process pool task: render a batch of _render_timeline_worker tasks."""
+    return [_render_timeline_worker(task) for task in tasks]
+
+
+# Chart worker state, installed once per process by _init_chart_worker
+_CHART_VISUALIZER = None
+_CHART_TASKS = None
+
+
+def _init_chart_worker(output_dir: Path, dpi: int, charts: List[tuple]) -> None:
+    """
+    Process pool initializer for Visualizer.plot_charts_parallel.
+    
+    The chart inputs arrive once per worker (inherited without pickling
+    under fork) rather than with every task.
+    """
+    global _CHART_VISUALIZER, _CHART_TASKS
+    _CHART_VISUALIZER = Visualizer(output_dir, dpi)
+    _CHART_TASKS = charts
+
+
+def _render_chart_worker(index: int) -> str:
+    """Process pool task: run chart `index` of the installed chart list."""
+    method_name, args, kwargs = _CHART_TASKS[index]
+    return getattr(_CHART_VISUALIZER, method_name)(*args, **kwargs)
+
+
+def _chart_result(method_name: str, render) -> Optional[str]:
+    """
+    Run one chart render, logging its failure instead of raising.
+    
+    A broken pool is re-raised so the caller can fall back to sequential
+    rendering; any other error only costs this one chart.
+    
+    Returns:
+        Saved plot path, or None if the chart failed
+    """
+    try:
+        return render()
+    except BrokenProcessPool:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to render {method_name}: {e}")
+        return None
 
 
 class Visualizer:
     """Create visualizations for interval mismatch analysis."""
     
-    def __init__(self, output_dir: Path = PLOTS_DIR):
+    def __init__(self, output_dir: Path = PLOTS_DIR, dpi: int = 150):
         self.output_dir = output_dir
+        self.dpi = dpi
+        _warm_fonts()
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._fig = None
+        self._timeline_fig = None
+        self._timeline_axes = None
+    
+    def _get_figure(self, figsize: tuple, nrows: int = 1, ncols: int = 1, **subplot_kw):
+        """
+        Return the shared figure resized to figsize, with fresh axes.
+        
+        The one-off plot methods all draw on this one Figure and its Agg
+        canvas instead of allocating and closing a figure each; only the axes
+        are rebuilt.
+        
+        Args:
+            figsize: Figure size in inches
+            nrows, ncols: Subplot grid shape
+            **subplot_kw: Passed to Figure.subplots (e.g. sharex)
+        
+        Returns:
+            Tuple of (fig, axes) as from Figure.subplots
+        """
+        if self._fig is None:
+            self._fig = _new_figure(figsize=figsize, layout='constrained')
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(figsize)
+        return self._fig, self._fig.subplots(nrows, ncols, **subplot_kw)
+    
+    def _get_timeline_axes(self):
+        """
+        Return the reusable timeline figure and its (ax1, ax2), cleared.
+        
+        plot_timeline_from_df runs once per symbol; reusing one figure skips
+        rebuilding the Figure, Axes and their spine/tick artists every call.
+        """
+        if self._timeline_fig is None:
+            self._timeline_fig = _new_figure(figsize=(16, 10), layout='constrained')
+            self._timeline_axes = self._timeline_fig.subplots(2, 1, sharex=True)
+        else:
+            for ax in self._timeline_axes:
+                ax.cla()
+        return self._timeline_fig, self._timeline_axes
+    
+    def _save(self, fig: Figure, output_path: Path, dpi: Optional[int] = None) -> None:
+        """
+        Save a figure as PNG with cheap encoder settings.
+        
+        zlib level 3 encodes several times faster than the default level 6 for
+        flat-colored plots at a small size cost. Analysis plots use self.dpi
+        (150 by default: flat bars and text need no more); the per-symbol
+        timelines pass dpi=300 for their dense hourly lines. Figures are
+        created with constrained layout, so no bbox_inches='tight' measuring
+        render is needed. With FAST_PNG the figure is drawn once and its RGBA
+        buffer goes straight to Pillow at zlib level 1.
+        
+        Args:
+            fig: Figure to save
+            output_path: Destination PNG path
+            dpi: Output resolution (default: self.dpi)
+        """
+        dpi = dpi or self.dpi
+        if FAST_PNG:
+            fig.set_dpi(dpi)
+            fig.canvas.draw()
+            Image.frombuffer(
+                'RGBA', fig.canvas.get_width_height(physical=True), fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1
+            ).save(output_path, format='PNG', compress_level=1, optimize=False, dpi=(dpi, dpi))
+            return
+        
+        fig.savefig(
+            output_path,
+            dpi=dpi,
+            pil_kwargs={'compress_level': 3, 'optimize': False}
+        )
+    
+    @staticmethod
+    def _close(fig: Figure) -> None:
+        """Release a figure's artists (figures are not registered with pyplot)."""
+        fig.clear()
+    
+    def close(self) -> None:
+        """Close the reusable shared and timeline figures, if created."""
+        if self._fig is not None:
+            self._close(self._fig)
+            self._fig = None
+        if self._timeline_fig is not None:
+            self._close(self._timeline_fig)
+            self._timeline_fig = None
+            self._timeline_axes = None
     
     def plot_heatmap(
         self,
-        interval_matrices: Dict[str, pd.DataFrame],
+        interval_matrix: np.ndarray,
+        symbols: List[str],
+        slot_times: pd.DatetimeIndex,
         top_n: int = 20
     ) -> str:
         """
         Create heatmap showing interval differences over time for multiple symbols.
         
         Args:
-            interval_matrices: Dict mapping symbol to interval difference DataFrame
+            interval_matrix: int8 array (n_symbols, n_slots) of hourly interval
+                differences, -1 where a symbol has no data
+            symbols: Symbol for each matrix row
+            slot_times: Datetime for each matrix column
             top_n: Number of symbols to display
         
         Returns:
             Path to saved plot
         """
-        if not interval_matrices:
+        has_data = (interval_matrix >= 0).any(axis=1)
+        if not has_data.any():
             logger.warning("No data for heatmap")
             return ""
         
-        # Select top N symbols by number of mismatch hours
-        symbol_mismatch_hours = {}
-        for symbol, df in interval_matrices.items():
-            if not df.empty:
-                mismatch_hours = (df['interval_diff'] > 0).sum()
-                symbol_mismatch_hours[symbol] = mismatch_hours
-        
-        top_symbols = sorted(
-            symbol_mismatch_hours.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:top_n]
-        
-        if not top_symbols:
-            logger.warning("No symbols with mismatches for heatmap")
-            return ""
-        
-        # Prepare data for heatmap
-        heatmap_data = []
-        for symbol, _ in top_symbols:
-            df = interval_matrices[symbol]
-            if not df.empty:
-                df_indexed = df.set_index('datetime')
-                heatmap_data.append(df_indexed['interval_diff'])
-        
-        if not heatmap_data:
-            return ""
-        
-        # Create heatmap matrix
-        heatmap_df = pd.concat(heatmap_data, axis=1)
-        heatmap_df.columns = [s[0] for s in top_symbols]
-        
-        # Resample to daily for better visualization
-        heatmap_df_daily = heatmap_df.resample('D').mean()
+        # Select top N symbols by number of mismatch hours (one pass over the matrix)
+        rows = np.flatnonzero(has_data)
+        mismatch_hours = np.count_nonzero(interval_matrix[rows] > 0, axis=1)
+        top_rows = rows[_top_n_indices(mismatch_hours, top_n)]
+        
+        # Trim to the slots covered by at least one selected symbol
+        top_matrix = interval_matrix[top_rows]
+        covered_slots = np.flatnonzero((top_matrix >= 0).any(axis=0))
+        slot_range = slice(covered_slots[0], covered_slots[-1] + 1)
+        
+        # Resample to daily for better visualization: per-day mean over hours
+        # with data (-1 = no data), summed directly on the int8 matrix
+        values = top_matrix[:, slot_range]
+        has_value = values >= 0
+        days = slot_times[slot_range].normalize()
+        day_starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        day_sums = np.add.reduceat(np.where(has_value, values, 0), day_starts, axis=1)
+        day_counts = np.add.reduceat(has_value, day_starts, axis=1)
+        with np.errstate(invalid='ignore'):
+            daily_mean = day_sums / day_counts  # NaN for days without data
+        
+        heatmap_df_daily = pd.DataFrame(
+            daily_mean.T,
+            index=days[day_starts],
+            columns=[symbols[i] for i in top_rows]
+        )
         
         # Plot
-        fig, ax = plt.subplots(figsize=(16, 10))
-        
-        # Create custom colormap: green (0) -> yellow (1-3) -> red (>3)
-        colors = ['#2ecc71', '#f1c40f', '#e74c3c']
-        n_bins = 100
-        cmap = sns.blend_palette(colors, n_colors=n_bins, as_cmap=True)
+        fig, ax = self._get_figure((16, 10))
         
         sns.heatmap(
             heatmap_df_daily.T,
-            cmap=cmap,
+            cmap=_HEATMAP_CMAP,
             cbar_kws={'label': 'Interval Difference (hours)'},
             linewidths=0.5,
             linecolor='white',
@@ -114,14 +360,11 @@ class Visualizer:
         ax.set_ylabel('Symbol', fontsize=12)
         
         # Rotate x-axis labels
-        plt.xticks(rotation=45, ha='right')
-        plt.yticks(rotation=0)
-        
-        plt.tight_layout()
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
+        setp(ax.get_yticklabels(), rotation=0)
         
         output_path = self.output_dir / 'interval_mismatch_heatmap.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save(fig, output_path)
         
         logger.info(f"Saved heatmap to {output_path}")
         return str(output_path)
@@ -145,11 +388,11 @@ class Visualizer:
         
         df = stats['dataframe']
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, (ax1, ax2) = self._get_figure((16, 6), 1, 2)
         
         # Histogram with custom bins
         bins = [0, 1, 4, 12, 24, 48, 100]
-        ax1.hist(df['duration_hours'], bins=bins, edgecolor='black', alpha=0.7, color='#3498db')
+        ax1.hist(df['duration_hours'].to_numpy(), bins=bins, edgecolor='black', alpha=0.7, color='#3498db')
         ax1.set_xlabel('Duration (hours)', fontsize=12)
         ax1.set_ylabel('Number of Events', fontsize=12)
         ax1.set_title('Mismatch Event Duration Distribution', fontsize=14, fontweight='bold')
@@ -165,7 +408,7 @@ class Visualizer:
         # Bar chart of duration buckets
         buckets = stats['duration_buckets']
         bucket_names = list(buckets.keys())
-        bucket_values = list(buckets.values())
+        bucket_values = np.fromiter(buckets.values(), dtype=np.int64, count=len(buckets))
         
         bars = ax2.bar(bucket_names, bucket_values, edgecolor='black', alpha=0.7, color='#e74c3c')
         ax2.set_xlabel('Duration Range', fontsize=12)
@@ -174,23 +417,10 @@ class Visualizer:
         ax2.grid(True, alpha=0.3, axis='y')
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(
-                bar.get_x() + bar.get_width()/2.,
-                height,
-                f'{int(height)}',
-                ha='center',
-                va='bottom',
-                fontsize=10,
-                fontweight='bold'
-            )
-        
-        plt.tight_layout()
+        ax2.bar_label(bars, fmt='%d', padding=0, fontsize=10, fontweight='bold')
         
         output_path = self.output_dir / 'duration_histogram.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save(fig, output_path)
         
         logger.info(f"Saved duration histogram to {output_path}")
         return str(output_path)
@@ -218,7 +448,7 @@ class Visualizer:
                 logger.warning("No tradable opportunities for symbol ranking")
                 return ""
             
-            top_symbols = dict(list(stats['top_symbols_by_tradable'].items())[:top_n])
+            top_symbols = dict(islice(stats['top_symbols_by_tradable'].items(), top_n))
             xlabel_text = 'Number of Tradable Opportunities'
             title_text = f'Top {top_n} Symbols by Tradable Opportunities'
         else:
@@ -227,14 +457,14 @@ class Visualizer:
                 logger.warning("No events for symbol ranking")
                 return ""
             
-            top_symbols = dict(list(stats['top_symbols'].items())[:top_n])
+            top_symbols = dict(islice(stats['top_symbols'].items(), top_n))
             xlabel_text = 'Number of Mismatch Events'
             title_text = f'Top {top_n} Symbols by Mismatch Frequency'
         
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = self._get_figure((14, 8))
         
         symbols = list(top_symbols.keys())
-        counts = list(top_symbols.values())
+        counts = np.fromiter(top_symbols.values(), dtype=np.int64, count=len(top_symbols))
         
         bars = ax.barh(symbols, counts, edgecolor='black', alpha=0.7, color='#9b59b6')
         
@@ -248,26 +478,13 @@ class Visualizer:
         ax.grid(True, alpha=0.3, axis='x')
         
         # Add value labels
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(
-                width,
-                bar.get_y() + bar.get_height()/2.,
-                f' {int(width)}',
-                ha='left',
-                va='center',
-                fontsize=9,
-                fontweight='bold'
-            )
+        ax.bar_label(bars, fmt=' %d', padding=0, fontsize=9, fontweight='bold')
         
         # Invert y-axis to show highest at top
         ax.invert_yaxis()
         
-        plt.tight_layout()
-        
         output_path = self.output_dir / 'symbol_ranking.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save(fig, output_path)
         
         logger.info(f"Saved symbol ranking to {output_path}")
         return str(output_path)
@@ -313,33 +530,35 @@ class Visualizer:
         logger.info(f"  Binance time range: {bn_df['datetime'].min()} to {bn_df['datetime'].max()}")
         logger.info(f"  Bybit time range: {by_df['datetime'].min()} to {by_df['datetime'].max()}")
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 10), sharex=True)
+        fig, (ax1, ax2) = self._get_figure((16, 10), 2, 1, sharex=True)
         
         # ===== 第一個子圖：Interval =====
         # Plot Binance intervals
         ax1.plot(
-            bn_df['datetime'],
-            bn_df['interval_hours'],
+            bn_df['datetime'].to_numpy(),
+            bn_df['interval_hours'].to_numpy(),
             marker='o',
             linestyle='-',
             linewidth=2,
             markersize=4,
             label=f'Binance ({len(bn_df)} records)',
             color='#f39c12',
-            alpha=0.8
+            alpha=0.8,
+            rasterized=True
         )
         
         # Plot Bybit intervals
         ax1.plot(
-            by_df['datetime'],
-            by_df['interval_hours'],
+            by_df['datetime'].to_numpy(),
+            by_df['interval_hours'].to_numpy(),
             marker='s',
             linestyle='-',
             linewidth=2,
             markersize=4,
             label=f'Bybit ({len(by_df)} records)',
             color='#3498db',
-            alpha=0.8
+            alpha=0.8,
+            rasterized=True
         )
         
         ax1.set_ylabel('Funding Interval (hours)', fontsize=12)
@@ -355,28 +574,30 @@ class Visualizer:
         # ===== 第二個子圖：Funding Rate =====
         # Plot Binance funding rates
         ax2.plot(
-            bn_df['datetime'],
-            bn_df['fundingRate'] * 10000,
+            bn_df['datetime'].to_numpy(),
+            bn_df['fundingRate'].to_numpy() * 10000,
             marker='o',
             linestyle='-',
             linewidth=1.5,
             markersize=3,
             label=f'Binance',
             color='#f39c12',
-            alpha=0.7
+            alpha=0.7,
+            rasterized=True
         )
         
         # Plot Bybit funding rates
         ax2.plot(
-            by_df['datetime'],
-            by_df['fundingRate'] * 10000,
+            by_df['datetime'].to_numpy(),
+            by_df['fundingRate'].to_numpy() * 10000,
             marker='s',
             linestyle='-',
             linewidth=1.5,
             markersize=3,
             label=f'Bybit',
             color='#3498db',
-            alpha=0.7
+            alpha=0.7,
+            rasterized=True
         )
         
         ax2.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
@@ -386,12 +607,10 @@ class Visualizer:
         ax2.legend(loc='upper right', fontsize=11)
         ax2.grid(True, alpha=0.3)
         
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        setp(ax2.get_xticklabels(), rotation=45, ha='right')
         
         output_path = self.output_dir / f'timeline_{symbol}.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save(fig, output_path, dpi=300)
         
         logger.info(f"Saved timeline to {output_path}")
         return str(output_path)
@@ -420,41 +639,50 @@ class Visualizer:
             timeline_df = timeline_df.copy()
             timeline_df['datetime'] = pd.to_datetime(timeline_df['datetime'])
         
+        # Extract the plotted columns once; Line2D takes ndarrays without Series conversion
+        datetimes = timeline_df['datetime'].to_numpy()
+        bn_interval = timeline_df['binance_interval'].to_numpy()
+        by_interval = timeline_df['bybit_interval'].to_numpy()
+        bn_rate_bp = timeline_df['binance_rate'].to_numpy() * 10000
+        by_rate_bp = timeline_df['bybit_rate'].to_numpy() * 10000
+        
         logger.info(f"Timeline from DataFrame for {symbol}:")
         logger.info(f"  Total records: {len(timeline_df)}")
-        logger.info(f"  Time range: {timeline_df['datetime'].min()} to {timeline_df['datetime'].max()}")
+        logger.info(f"  Time range: {pd.Timestamp(datetimes.min())} to {pd.Timestamp(datetimes.max())}")
         
         # Create subdirectory for mismatch symbols if it doesn't exist
         mismatch_dir = self.output_dir / 'mismatch_symbol'
         mismatch_dir.mkdir(parents=True, exist_ok=True)
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 10), sharex=True)
+        fig, (ax1, ax2) = self._get_timeline_axes()
         
         # ===== 第一個子圖：Interval =====
         # Plot Binance intervals
         ax1.plot(
-            timeline_df['datetime'],
-            timeline_df['binance_interval'],
+            datetimes,
+            bn_interval,
             marker='o',
             linestyle='-',
             linewidth=2,
             markersize=3,
             label=f'Binance',
             color='#f39c12',
-            alpha=0.8
+            alpha=0.8,
+            rasterized=True
         )
         
         # Plot Bybit intervals
         ax1.plot(
-            timeline_df['datetime'],
-            timeline_df['bybit_interval'],
+            datetimes,
+            by_interval,
             marker='s',
             linestyle='-',
             linewidth=2,
             markersize=3,
             label=f'Bybit',
             color='#3498db',
-            alpha=0.8
+            alpha=0.8,
+            rasterized=True
         )
         
         # ❌ 移除: Highlight mismatch periods with X markers
@@ -475,51 +703,46 @@ class Visualizer:
         # ===== 第二個子圖：Funding Rate =====
         # Plot Binance funding rates
         ax2.plot(
-            timeline_df['datetime'],
-            timeline_df['binance_rate'] * 10000,
+            datetimes,
+            bn_rate_bp,
             marker='o',
             linestyle='-',
             linewidth=1.5,
             markersize=2,
             label=f'Binance',
             color='#f39c12',
-            alpha=0.7
+            alpha=0.7,
+            rasterized=True
         )
         
         # Plot Bybit funding rates
         ax2.plot(
-            timeline_df['datetime'],
-            timeline_df['bybit_rate'] * 10000,
+            datetimes,
+            by_rate_bp,
             marker='s',
             linestyle='-',
             linewidth=1.5,
             markersize=2,
             label=f'Bybit',
             color='#3498db',
-            alpha=0.7
+            alpha=0.7,
+            rasterized=True
         )
         
         # Highlight mismatch periods in funding rate chart (with red background)
         # Only highlight when there's actually a mismatch (is_mismatch == True)
         # This creates individual red spans for each continuous mismatch period
-        mismatches_mask = timeline_df['is_mismatch'] == True
-        
-        if mismatches_mask.any():
-            # Group continuous mismatch periods
-            mismatch_groups = (mismatches_mask != mismatches_mask.shift()).cumsum()
-            
-            for group_id in mismatch_groups[mismatches_mask].unique():
-                group_data = timeline_df[mismatch_groups == group_id]
-                group_start = group_data['datetime'].min()
-                group_end = group_data['datetime'].max()
-                
-                ax2.axvspan(
-                    group_start,
-                    group_end,
-                    alpha=0.1,
-                    color='red',
-                    label='Mismatch Period' if group_id == mismatch_groups[mismatches_mask].unique()[0] else ""
-                )
+        mismatches_mask = (timeline_df['is_mismatch'] == True).to_numpy()
+        
+        # Continuous mismatch periods as (start, end) row indices, found in one pass
+        for i, (run_start, run_end) in enumerate(find_true_runs(mismatches_mask)):
+            ax2.axvspan(
+                datetimes[run_start],
+                datetimes[run_end],
+                alpha=0.1,
+                color='red',
+                label='Mismatch Period' if i == 0 else ""
+            )
         
         ax2.axhline(y=0, color='black', linestyle='--', linewidth=1, alpha=0.5)
         ax2.set_xlabel('Date', fontsize=12)
@@ -528,17 +751,107 @@ class Visualizer:
         ax2.legend(loc='upper right', fontsize=11)
         ax2.grid(True, alpha=0.3)
         
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        setp(ax2.get_xticklabels(), rotation=45, ha='right')
         
         # Save to mismatch_symbol subdirectory
         output_path = mismatch_dir / f'timeline_{symbol}.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save(fig, output_path, dpi=300)
         
         logger.info(f"Saved timeline from DataFrame to {output_path}")
         return str(output_path)
     
+    def plot_charts_parallel(
+        self,
+        charts: List[tuple],
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Run independent plot_* methods concurrently on a process pool.
+        
+        Each chart is CPU-bound (draw + PNG encode) and only returns its path,
+        so the charts render side by side instead of one after another. A chart
+        that raises is logged and skipped; only a pool failure falls back to
+        rendering sequentially in this process.
+        
+        Args:
+            charts: List of (method_name, args, kwargs) for plot_* methods
+            max_workers: Number of worker processes (default: os.cpu_count())
+        
+        Returns:
+            List of saved plot paths ("" for skipped charts, None for failed
+            ones), in input order
+        """
+        if not charts:
+            return []
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(charts))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_chart_worker,
+                initargs=(self.output_dir, self.dpi, charts)
+            ) as executor:
+                futures = [executor.submit(_render_chart_worker, i) for i in range(len(charts))]
+                return [
+                    _chart_result(name, future.result)
+                    for (name, _, _), future in zip(charts, futures)
+                ]
+        except (BrokenProcessPool, OSError) as e:
+            logger.error(f"Parallel chart rendering failed, falling back to sequential: {e}")
+            return [
+                _chart_result(name, lambda: getattr(self, name)(*args, **kwargs))
+                for name, args, kwargs in charts
+            ]
+    
+    def plot_timelines_parallel(
+        self,
+        timeline_dfs: Dict[str, pd.DataFrame],
+        max_workers: Optional[int] = None
+    ) -> List[tuple]:
+        """
+        Render plot_timeline_from_df for many symbols on a process pool.
+        
+        Each symbol's plot is independent and CPU-bound (draw + PNG encode),
+        so every worker renders on its own Agg canvas. Symbols are submitted in
+        chunks; a chunk that raises is reported as failed for its symbols and
+        the rest are kept. Only a pool failure falls back to rendering
+        sequentially in this process.
+        
+        Args:
+            timeline_dfs: Dict mapping symbol -> funding rate timeline DataFrame
+            max_workers: Number of worker processes (default: os.cpu_count())
+        
+        Returns:
+            List of (symbol, success: bool, message: str), in input order
+        """
+        tasks = [(self.output_dir, symbol, df) for symbol, df in timeline_dfs.items()]
+        if not tasks:
+            return []
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        chunksize = max(1, len(tasks) // (workers * 4))
+        chunks = [tasks[i:i + chunksize] for i in range(0, len(tasks), chunksize)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_render_timeline_chunk, chunk) for chunk in chunks]
+                results = []
+                for chunk, future in zip(chunks, futures):
+                    try:
+                        results.extend(future.result())
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        results.extend(
+                            (symbol, False, f"✗ Failed for {symbol}: {str(e)}")
+                            for _, symbol, _ in chunk
+                        )
+                return results
+        except (BrokenProcessPool, OSError) as e:
+            logger.error(f"Parallel timeline rendering failed, falling back to sequential: {e}")
+            results = [_timeline_task(self, symbol, df) for _, symbol, df in tasks]
+            self.close()
+            return results
+    
     def plot_mismatch_type_distribution(
         self,
         stats: Dict[str, Any]
@@ -558,13 +871,13 @@ class Visualizer:
         
         mismatch_types = stats['mismatch_type_distribution']
         
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = self._get_figure((10, 8))
         
         colors = sns.color_palette('Set2', len(mismatch_types))
         
         wedges, texts, autotexts = ax.pie(
-            mismatch_types.values(),
-            labels=mismatch_types.keys(),
+            np.fromiter(mismatch_types.values(), dtype=np.int64, count=len(mismatch_types)),
+            labels=list(mismatch_types.keys()),
             autopct='%1.1f%%',
             startangle=90,
             colors=colors,
@@ -584,11 +897,8 @@ class Visualizer:
             pad=20
         )
         
-        plt.tight_layout()
-        
         output_path = self.output_dir / 'mismatch_type_distribution.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save(fig, output_path)
         
         logger.info(f"Saved mismatch type distribution to {output_path}")
         return str(output_path)
@@ -614,8 +924,8 @@ class Visualizer:
         """
         logger.info("Generating tradable opportunities time-series plot...")
         
-        # Collect all tradable data points across all symbols
-        tradable_data = []
+        # Collect per-symbol frames of tradable data points; concatenated once below
+        frames = []
         
         for result in all_results:
             if result is None or result['funding_rate_timeline'].empty:
@@ -628,62 +938,51 @@ class Visualizer:
                 logger.warning(f"No 'tradable' column for {result['symbol']}, skipping")
                 continue
             
-            # Filter tradable rows only
-            tradable_df = df[df['tradable'] == True].copy()
+            # Filter tradable rows only (mask the needed columns, no frame copy)
+            mask = df['tradable'].to_numpy() == True
             
-            if tradable_df.empty:
+            if not mask.any():
                 continue
             
             # Convert datetime to proper format
-            tradable_df['datetime'] = pd.to_datetime(tradable_df['datetime'])
+            dt = pd.to_datetime(df['datetime'].to_numpy()[mask])
             
             # Calculate funding rate in basis points using absolute values
             # avg = (abs(binance_rate) + abs(bybit_rate)) / tradable_count
-            tradable_df['funding_rate_bp'] = tradable_df.apply(
-                lambda row: (abs(row['binance_rate']) * 10000 + abs(row['bybit_rate']) * 10000) / 2,
-                axis=1
-            )
+            # Masking copies, so the rest is done in place on that buffer
+            rate_bp = df['binance_rate'].to_numpy()[mask]
+            by_rate = df['bybit_rate'].to_numpy()[mask]
+            np.abs(rate_bp, out=rate_bp)
+            np.add(rate_bp, np.abs(by_rate, out=by_rate), out=rate_bp)
+            rate_bp *= 5000.0
             
-            # Store each tradable record
-            for _, row in tradable_df.iterrows():
-                tradable_data.append({
-                    'datetime': row['datetime'],
-                    'rate_bp': row['funding_rate_bp'],
-                    'symbol': result['symbol']
-                })
-        
-        if not tradable_data:
+            # Store this symbol's tradable records
+            frames.append(pd.DataFrame({'datetime': dt, 'rate_bp': rate_bp, 'symbol': result['symbol']}))
+        
+        if not frames:
             logger.warning("No tradable data found")
             return ""
         
-        # Convert to DataFrame for easier aggregation
-        tradable_df_all = pd.DataFrame(tradable_data)
+        # Single concat for easier aggregation
+        tradable_df_all = pd.concat(frames, ignore_index=True)
         
         # Group by datetime and calculate count and average rate
-        timeseries_data = tradable_df_all.groupby('datetime').agg({
-            'rate_bp': ['count', 'mean']
-        }).reset_index()
-        
-        # Flatten column names
-        timeseries_data.columns = ['datetime', 'opportunity', 'average_funding_bp']
-        timeseries_data = timeseries_data.sort_values('datetime').reset_index(drop=True)
-        
-        # Create continuous time series with hourly frequency
-        min_datetime = timeseries_data['datetime'].min()
-        max_datetime = timeseries_data['datetime'].max()
-        
-        # Generate all hourly timestamps between min and max
-        all_datetimes = pd.date_range(start=min_datetime, end=max_datetime, freq='1H')
-        continuous_timeseries = pd.DataFrame({'datetime': all_datetimes})
-        
-        # Merge with existing data, filling missing values with 0
-        timeseries_data = continuous_timeseries.merge(
-            timeseries_data, 
-            on='datetime', 
-            how='left'
+        timeseries_data = tradable_df_all.groupby('datetime')['rate_bp'].agg(['count', 'mean'])
+        timeseries_data.columns = ['opportunity', 'average_funding_bp']
+        
+        # Create continuous time series with hourly frequency between min and max,
+        # filling missing hours with 0 in a single reindex
+        all_datetimes = pd.date_range(
+            start=timeseries_data.index.min(),
+            end=timeseries_data.index.max(),
+            freq='1H'
+        )
+        timeseries_data = (
+            timeseries_data.reindex(all_datetimes, fill_value=0)
+            .rename_axis('datetime')
+            .reset_index()
         )
-        timeseries_data['opportunity'] = timeseries_data['opportunity'].fillna(0).astype(int)
-        timeseries_data['average_funding_bp'] = timeseries_data['average_funding_bp'].fillna(0).round(2)
+        timeseries_data['average_funding_bp'] = timeseries_data['average_funding_bp'].round(2)
         
         # Save to CSV
         csv_output_path = self.output_dir / 'tradable_opportunities_timeseries.csv'
@@ -693,13 +992,14 @@ class Visualizer:
         logger.info(f"\n{timeseries_data.to_string()}\n")
         
         # Create figure with two y-axes
-        fig, ax1 = plt.subplots(figsize=(24, 8))
+        fig, ax1 = self._get_figure((24, 8))
         
         # Plot 1: Average Funding Rate on left y-axis (bar chart)
         color1 = '#e74c3c'
         ax1.set_xlabel('DateTime (UTC)', fontsize=13, fontweight='bold')
         ax1.set_ylabel('Average Funding Rate (bp)', color=color1, fontsize=13, fontweight='bold')
-        bars = ax1.bar(range(len(timeseries_data)), timeseries_data['average_funding_bp'], 
+        x = np.arange(len(timeseries_data))
+        bars = ax1.bar(x, timeseries_data['average_funding_bp'].to_numpy(), 
                        color=color1, alpha=0.6, edgecolor='darkred', linewidth=0.5, label='Average Funding Rate (bp)')
         ax1.tick_params(axis='y', labelcolor=color1, labelsize=11)
         ax1.grid(True, alpha=0.3, axis='y')
@@ -710,7 +1010,7 @@ class Visualizer:
         ax2 = ax1.twinx()
         color2 = '#3498db'
         ax2.set_ylabel('Number of Tradable Opportunities', color=color2, fontsize=13, fontweight='bold')
-        line = ax2.plot(range(len(timeseries_data)), timeseries_data['opportunity'],
+        line = ax2.plot(x, timeseries_data['opportunity'].to_numpy(),
                         color=color2, linewidth=2.5, marker='o', markersize=4,
                         label='Opportunity Count', alpha=0.9)
         ax2.tick_params(axis='y', labelcolor=color2, labelsize=11)
@@ -718,13 +1018,13 @@ class Visualizer:
         ax2.set_ylim(bottom=0)
         
         # Set x-axis with datetime labels
-        ax1.set_xticks(range(0, len(timeseries_data), max(1, len(timeseries_data) // 20)))
-        x_labels = [timeseries_data.loc[i, 'datetime'].strftime('%Y-%m-%d %H:%M') 
-                   for i in range(0, len(timeseries_data), max(1, len(timeseries_data) // 20))]
+        tick_positions = np.arange(0, len(timeseries_data), max(1, len(timeseries_data) // 20))
+        ax1.set_xticks(tick_positions)
+        x_labels = timeseries_data['datetime'].iloc[tick_positions].dt.strftime('%Y-%m-%d %H:%M').tolist()
         ax1.set_xticklabels(x_labels, rotation=45, ha='right', fontsize=10)
         
-        # Title and legend
-        plt.title(
+        # Title and legend (on the twin axes, which draws on top)
+        ax2.set_title(
             'Tradable Opportunities Time Series Analysis',
             fontsize=15, fontweight='bold', pad=20
         )
@@ -734,18 +1034,16 @@ class Visualizer:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left', fontsize=12, framealpha=0.95)
         
-        plt.tight_layout()
-        
         output_path = self.output_dir / 'tradable_opportunities_by_hour.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save(fig, output_path)
         
         logger.info(f"Saved tradable opportunities time-series plot to {output_path}")
         logger.info(f"  Total time periods: {len(timeseries_data)}")
-        logger.info(f"  Periods with opportunities: {len(timeseries_data[timeseries_data['opportunity'] > 0])}")
-        peak_idx = timeseries_data['opportunity'].idxmax()
-        logger.info(f"  Peak: {timeseries_data.loc[peak_idx, 'datetime']} with {int(timeseries_data.loc[peak_idx, 'opportunity'])} opportunities")
-        logger.info(f"  Average funding rate: {timeseries_data['average_funding_bp'].mean():.2f} bp")
+        opportunity = timeseries_data['opportunity'].to_numpy()
+        logger.info(f"  Periods with opportunities: {np.count_nonzero(opportunity > 0)}")
+        peak_idx = opportunity.argmax()
+        logger.info(f"  Peak: {timeseries_data['datetime'].iloc[peak_idx]} with {int(opportunity[peak_idx])} opportunities")
+        logger.info(f"  Average funding rate: {timeseries_data['average_funding_bp'].to_numpy().mean():.2f} bp")
         
         return str(output_path)
     
@@ -772,53 +1070,52 @@ class Visualizer:
             funding_timeline = result['funding_rate_timeline']
             
             if not funding_timeline.empty:
-                # Filter for tradable opportunities only
-                tradable_rows = funding_timeline[funding_timeline['tradable'] == True]
+                # Filter for tradable opportunities only (mask the needed columns)
+                mask = funding_timeline['tradable'].to_numpy() == True
                 
-                if not tradable_rows.empty:
+                if mask.any():
                     # Calculate average cost of funding (the funding we need to pay)
                     # If binance_pay=False: we RECEIVE from Binance (use bybit's cost)
                     # If binance_pay=True: we PAY to Binance (use binance's cost)
-                    funding_costs = []
-                    for _, row in tradable_rows.iterrows():
-                        bn_rate_bp = abs(row['binance_rate']) * 10000 if row['binance_rate'] else 0
-                        by_rate_bp = abs(row['bybit_rate']) * 10000 if row['bybit_rate'] else 0
-                        
-                        # Determine which funding rate represents our cost
-                        # If binance_pay is False, we're receiving from Binance, so cost is Bybit's
-                        # If bybit_pay is True, we're paying to Bybit, so cost is Bybit's
-                        if not row.get('binance_pay', False) or row.get('bybit_pay', False):
-                            # We pay to Bybit (or receive from Binance)
-                            funding_costs.append(by_rate_bp)
-                        else:
-                            # We pay to Binance
-                            funding_costs.append(bn_rate_bp)
+                    bn_rate = funding_timeline['binance_rate'].to_numpy()[mask]
+                    by_rate = funding_timeline['bybit_rate'].to_numpy()[mask]
+                    binance_pay = funding_timeline['binance_pay'].to_numpy(dtype=bool)[mask]
+                    bybit_pay = funding_timeline['bybit_pay'].to_numpy(dtype=bool)[mask]
                     
-                    avg_funding = sum(funding_costs) / len(funding_costs) if funding_costs else 0
-                    tradable_funding_by_symbol[symbol] = avg_funding
+                    # If binance_pay is False, we're receiving from Binance, so cost is Bybit's
+                    # If bybit_pay is True, we're paying to Bybit, so cost is Bybit's
+                    # Select first, then abs/scale the one selected buffer in place;
+                    # missing rates count as zero cost instead of turning the average into NaN
+                    funding_costs = np.where(~binance_pay | bybit_pay, by_rate, bn_rate)
+                    np.nan_to_num(funding_costs, copy=False, nan=0.0)
+                    np.abs(funding_costs, out=funding_costs)
+                    funding_costs *= 10000
+                    tradable_funding_by_symbol[symbol] = float(funding_costs.mean())
         
         if not tradable_funding_by_symbol:
             logger.warning("No tradable opportunities found for funding analysis")
             return ""
         
-        # Sort by average funding rate (descending)
-        sorted_symbols = dict(sorted(
-            tradable_funding_by_symbol.items(),
-            key=lambda x: x[1],
-            reverse=True
-        ))
-        
-        # Take top 20
-        top_20 = dict(list(sorted_symbols.items())[:20])
+        # Top 20 by average funding rate (descending)
+        # Unicode array sized to the longest symbol (a fixed width would truncate)
+        all_symbols = np.array(list(tradable_funding_by_symbol))
+        all_fundings = np.fromiter(tradable_funding_by_symbol.values(), dtype=np.float64, count=len(all_symbols))
+        top_20 = _top_n_indices(all_fundings, 20)
         
-        fig, ax = plt.subplots(figsize=(14, 8))
+        symbols = all_symbols[top_20]
+        avg_fundings = all_fundings[top_20]
         
-        symbols = list(top_20.keys())
-        avg_fundings = list(top_20.values())
+        fig, ax = self._get_figure((14, 8))
         
-        # Color based on funding rate intensity
-        colors = plt.cm.RdYlGn_r([(x - min(avg_fundings)) / (max(avg_fundings) - min(avg_fundings)) 
-                                   for x in avg_fundings])
+        # Color based on funding rate intensity (min-max normalized); a single
+        # bar or all-equal values have no range, so they get the neutral mid color
+        lut_size = len(_FUNDING_BAR_LUT)
+        lo, hi = avg_fundings.min(), avg_fundings.max()
+        if hi > lo:
+            norm = (avg_fundings - lo) / (hi - lo)
+            colors = _FUNDING_BAR_LUT[np.minimum((norm * lut_size).astype(np.intp), lut_size - 1)]
+        else:
+            colors = np.tile(_FUNDING_BAR_LUT[lut_size // 2], (len(avg_fundings), 1))
         
         bars = ax.barh(symbols, avg_fundings, edgecolor='black', alpha=0.8, color=colors)
         
@@ -832,31 +1129,17 @@ class Visualizer:
         ax.grid(True, alpha=0.3, axis='x')
         
         # Add value labels
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(
-                width,
-                bar.get_y() + bar.get_height()/2.,
-                f' {width:.2f} bp',
-                ha='left',
-                va='center',
-                fontsize=9,
-                fontweight='bold'
-            )
+        ax.bar_label(bars, fmt=' %.2f bp', padding=0, fontsize=9, fontweight='bold')
         
         # Invert y-axis to show highest at top
         ax.invert_yaxis()
         
-        plt.tight_layout()
-        
         output_path = self.output_dir / 'tradable_avg_funding_by_symbol.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save(fig, output_path)
         
         logger.info(f"Saved tradable average funding by symbol plot to {output_path}")
         logger.info(f"  Symbols with tradable opportunities: {len(tradable_funding_by_symbol)}")
         logger.info(f"  Top symbol: {symbols[0]} with {avg_fundings[0]:.2f} bp average funding")
-        logger.info(f"  Average across all: {sum(avg_fundings) / len(avg_fundings):.2f} bp")
+        logger.info(f"  Average across all: {avg_fundings.mean():.2f} bp")
         
         return str(output_path)
-